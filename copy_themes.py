@@ -4,60 +4,184 @@ Script to copy theme files from user config to project bundled_themes directory.
 Run this to update the bundled themes that ship with the app.
 """
 
+import argparse
+import functools
 import os
-import shutil
+import stat
+import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Paths
 config_dir = os.path.expanduser('~/.config/dsclock')
 themes_dir = os.path.join(config_dir, 'themes')
 project_dir = os.path.dirname(os.path.abspath(__file__))
 bundled_themes_dir = os.path.join(project_dir, 'bundled_themes')
+bundled_themes_prefix = bundled_themes_dir + os.sep
+
+def _looks_like_json(data):
+    """Cheap structural check: non-empty and wrapped in matching braces/brackets."""
+    data = data.strip()
+    return len(data) >= 2 and (data[:1], data[-1:]) in ((b'{', b'}'), (b'[', b']'))
+
+def _fast_copy(src, dst, trust_source=False):
+    """Validate src as JSON and copy it to dst, reading the source only once.
+    
+    Preserves mode and times like shutil.copy2. Raises json.JSONDecodeError
+    (before dst is touched) when src is not valid JSON. With trust_source
+    only a structural check is done instead of a full parse.
+    
+    Returns False without rewriting when dst already holds the same bytes;
+    dst's mode and times are still synced so the next run's size+mtime
+    check in _process skips it without reading either file.
+    """
+    in_fd = os.open(src, os.O_RDONLY)
+    try:
+        st = os.fstat(in_fd)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        with open(in_fd, 'rb', closefd=False) as f:
+            data = f.read()
+        # One-shot tool: don't leave the source pages in the page cache
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(in_fd)
+    
+    # Validate the same buffer we are about to write
+    if trust_source:
+        if not _looks_like_json(data):
+            raise json.JSONDecodeError("Not a JSON object or array", data.decode('utf-8', 'replace'), 0)
+    else:
+        json.loads(data)
+    
+    mode = stat.S_IMODE(st.st_mode)
+    times = (st.st_atime_ns, st.st_mtime_ns)
+    
+    # Identical bytes already bundled: don't rewrite, only bring the metadata
+    # in line (the app rewrites themes on save, bumping only the mtime)
+    try:
+        with open(dst, 'rb') as f:
+            dst_st = os.fstat(f.fileno())
+            same = dst_st.st_size == len(data) and f.read() == data
+        if same:
+            if stat.S_IMODE(dst_st.st_mode) != mode:
+                os.chmod(dst, mode)
+            if dst_st.st_mtime_ns != st.st_mtime_ns:
+                os.utime(dst, ns=times)
+            return False
+    except FileNotFoundError:
+        pass
+    
+    # Set metadata through the open descriptor where the platform allows it
+    # (no second path lookup, no xattr pass). Checked per call: Windows has
+    # fchmod since 3.13 but still can't utime a descriptor.
+    with open(dst, 'wb') as f:
+        f.write(data)
+        f.flush()
+        if os.chmod in os.supports_fd:
+            os.chmod(f.fileno(), mode)
+        if os.utime in os.supports_fd:
+            os.utime(f.fileno(), ns=times)
+    
+    if os.chmod not in os.supports_fd:
+        os.chmod(dst, mode)
+    if os.utime not in os.supports_fd:
+        os.utime(dst, ns=times)
+    return True
+
+def _process(entry, trust_source=False):
+    """Validate and copy a single theme.
+    
+    Returns a (status, theme_file, error) tuple; error is the raw exception
+    and is only formatted by main() once all workers are done.
+    """
+    theme_file = entry.name
+    src = entry.path
+    dst = bundled_themes_prefix + theme_file
+    
+    # _fast_copy preserves mtime, so a matching size and mtime means
+    # the bundled copy is already up to date
+    try:
+        st = entry.stat()
+        dst_st = os.stat(dst)
+    except OSError:
+        dst_st = None
+    if dst_st is not None and (dst_st.st_size, dst_st.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+        return 'unchanged', theme_file, None
+    
+    # Validate it's a valid JSON file and copy it
+    try:
+        if not _fast_copy(src, dst, trust_source):
+            return 'unchanged', theme_file, None
+        return 'copied', theme_file, None
+        
+    except json.JSONDecodeError as e:
+        return 'skipped', theme_file, e
+    except Exception as e:
+        return 'error', theme_file, e
 
 def main():
     """Copy theme files from config to project bundled_themes directory."""
+    parser = argparse.ArgumentParser(
+        description='Copy theme files from the user config to bundled_themes/.')
+    parser.add_argument('--trust-source', action='store_true',
+                       help='only check that each theme looks like a JSON object instead of fully parsing it')
+    args = parser.parse_args()
+    process = functools.partial(_process, trust_source=args.trust_source)
     
-    if not os.path.exists(themes_dir):
+    # Get list of theme files (DirEntry caches the file type of regular files, so
+    # only symlinked themes cost a stat; those are followed and copied too)
+    try:
+        with os.scandir(themes_dir) as it:
+            entries = [e for e in it if e.name.endswith('.json') and e.is_file()]
+    except FileNotFoundError:
         print(f"Error: Themes directory not found: {themes_dir}")
         print("Please create some themes first using the app.")
         return 1
     
-    # Create bundled_themes directory if it doesn't exist
-    os.makedirs(bundled_themes_dir, exist_ok=True)
-    
-    # Get list of theme files
-    theme_files = [f for f in os.listdir(themes_dir) if f.endswith('.json')]
+    # Create bundled_themes directory if it doesn't exist (project_dir always does)
+    try:
+        os.mkdir(bundled_themes_dir)
+    except FileExistsError:
+        pass
     
-    if not theme_files:
+    if not entries:
         print(f"No theme files found in {themes_dir}")
         return 1
     
-    print(f"Found {len(theme_files)} theme(s) in {themes_dir}")
+    print(f"Found {len(entries)} theme(s) in {themes_dir}")
     print()
     
-    # Copy each theme file
+    # Copy each theme file; workers return their result so printing stays in order
+    if len(entries) < 4:
+        results = [process(entry) for entry in entries]
+    else:
+        max_workers = min(32, (os.cpu_count() or 4) * 4, len(entries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(process, entries))
+    
     copied = 0
-    for theme_file in theme_files:
-        src = os.path.join(themes_dir, theme_file)
-        dst = os.path.join(bundled_themes_dir, theme_file)
-        
-        # Validate it's a valid JSON file
-        try:
-            with open(src, 'r') as f:
-                theme_data = json.load(f)
-            
-            # Copy the file
-            shutil.copy2(src, dst)
-            print(f"✓ Copied: {theme_file}")
+    unchanged = 0
+    lines = []
+    for status, theme_file, error in results:
+        if status == 'copied':
+            lines.append(f"✓ Copied: {theme_file}")
             copied += 1
-            
-        except json.JSONDecodeError as e:
-            print(f"✗ Skipped {theme_file}: Invalid JSON - {e}")
-        except Exception as e:
-            print(f"✗ Error copying {theme_file}: {e}")
+        elif status == 'unchanged':
+            lines.append(f"• Unchanged: {theme_file}")
+            unchanged += 1
+        elif status == 'skipped':
+            lines.append(f"✗ Skipped {theme_file}: Invalid JSON - {error}")
+        else:
+            lines.append(f"✗ Error copying {theme_file}: {error}")
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     print()
     print(f"Successfully copied {copied} theme(s) to {bundled_themes_dir}")
+    if unchanged:
+        print(f"{unchanged} theme(s) were already up to date")
     print()
     print("Next steps:")
     print("1. Review the copied themes in bundled_themes/")
@@ -4,15 +4,220 @@ Dialog classes for dsclock application
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk, GdkPixbuf, Pango
+from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, Pango
+import cairo
 
+import hashlib
 import os
 import shutil
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime as _datetime
+from functools import lru_cache, partial
+from math import exp as _exp, log as _log, log2 as _log2
+
+from theme import Theme
+
+
+# Stylesheet for the customize dialog, registered once for the screen
+DIALOG_CSS = b"""
+    flowboxchild:selected {
+        background-color: rgba(100, 150, 200, 0.15);
+        border: 2px solid rgba(100, 150, 200, 0.3);
+    }
+    
+    /* Hex color labels; not every GTK theme defines this class */
+    .monospace {
+        font-family: monospace;
+    }
+"""
+
+# Selection highlight for the texture and hand pickers
+PICKER_CSS = b"""
+    flowboxchild:selected {
+        background-color: rgba(100, 100, 100, 0.2);
+    }
+"""
+
+# Hand width slider ranges: image hands scale their picture logarithmically,
+# geometric hands set a line width whose useful range depends on the hand
+_IMAGE_HAND_WIDTH_RANGE = (0.33, 3.0)
+_GEOMETRIC_HAND_WIDTH_RANGES = {'hour': (0.01, 0.08), 'minute': (0.005, 0.05), 'second': (0.002, 0.02)}
+
+# File extensions (lowercase) listed in the texture picker
+_TEXTURE_EXTENSIONS = frozenset(('.png', '.jpg', '.jpeg'))
+
+# Tick style ids and labels shared by the hour and minute style combos
+_TICK_STYLES = (("square", "Square"), ("round", "Round"), ("rectangular", "Rectangular"))
+
+# Preset date formats offered in the Date Box page, in display order
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%B %d, %Y", "%d %b %Y", "%A, %B %d", "%a %d %b")
+
+# Options page layout; switch states are filled in from settings at build time
+_OPTIONS_PAGE_UI = """<interface>
+  <object class="GtkGrid" id="grid">
+    <property name="column_spacing">12</property>
+    <property name="row_spacing">12</property>
+    <property name="margin_start">24</property>
+    <property name="margin_end">24</property>
+    <property name="margin_top">24</property>
+    <property name="margin_bottom">24</property>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">&lt;b&gt;System Options&lt;/b&gt;</property>
+        <property name="use_markup">True</property>
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">0</property><property name="width">2</property></packing>
+    </child>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">Auto Start on Logon:</property>
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">1</property></packing>
+    </child>
+    <child>
+      <object class="GtkSwitch" id="autostart_switch">
+        <property name="halign">start</property>
+        <signal name="notify::active" handler="on_autostart_toggled"/>
+      </object>
+      <packing><property name="left_attach">1</property><property name="top_attach">1</property></packing>
+    </child>
+    <child>
+      <object class="GtkSeparator">
+        <property name="orientation">horizontal</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">2</property><property name="width">2</property></packing>
+    </child>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">&lt;b&gt;Display Options&lt;/b&gt;</property>
+        <property name="use_markup">True</property>
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">3</property><property name="width">2</property></packing>
+    </child>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">Show Date:</property>
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">4</property></packing>
+    </child>
+    <child>
+      <object class="GtkSwitch" id="show_date_switch">
+        <property name="halign">start</property>
+        <signal name="notify::active" handler="on_show_date_toggled"/>
+      </object>
+      <packing><property name="left_attach">1</property><property name="top_attach">4</property></packing>
+    </child>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">Show Seconds:</property>
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">5</property></packing>
+    </child>
+    <child>
+      <object class="GtkSwitch" id="show_seconds_switch">
+        <property name="halign">start</property>
+        <signal name="notify::active" handler="on_show_seconds_toggled"/>
+      </object>
+      <packing><property name="left_attach">1</property><property name="top_attach">5</property></packing>
+    </child>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">Snap Minute Hand:</property>
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">6</property></packing>
+    </child>
+    <child>
+      <object class="GtkSwitch" id="snap_minute_switch">
+        <property name="halign">start</property>
+        <signal name="notify::active" handler="on_minute_hand_snap_toggled"/>
+      </object>
+      <packing><property name="left_attach">1</property><property name="top_attach">6</property></packing>
+    </child>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">Always on Top:</property>
+        <property name="halign">start</property>
+      </object>
+      <packing><property name="left_attach">0</property><property name="top_attach">7</property></packing>
+    </child>
+    <child>
+      <object class="GtkSwitch" id="always_on_top_switch">
+        <property name="halign">start</property>
+        <signal name="notify::active" handler="on_always_on_top_toggled_dialog"/>
+      </object>
+      <packing><property name="left_attach">1</property><property name="top_attach">7</property></packing>
+    </child>
+  </object>
+</interface>
+"""
+
+@lru_cache(maxsize=4096)
+def _hex_cached(r, g, b):
+    """Format 0-255 channel values as #RRGGBB"""
+    return '#' + bytes((r, g, b)).hex().upper()
+
+def _color_to_hex(color_tuple, _int=int):
+    """Convert (R, G, B) tuple (0.0-1.0) to hex string #RRGGBB"""
+    return _hex_cached(_int(color_tuple[0] * 255), _int(color_tuple[1] * 255), _int(color_tuple[2] * 255))
+
+def _color_set(dialog, hex_label, on_change, button):
+    """color-set handler for _add_color_button: refresh the hex label and schedule on_change"""
+    rgba = button.get_rgba()
+    hex_label.set_text(_color_to_hex((rgba.red, rgba.green, rgba.blue)))
+    dialog._debounce(on_change, button, id(button))
+
+class _LogScaleValue:
+    """Stands in for a logarithmic Gtk.Scale in callbacks, reporting the un-logged value"""
+    __slots__ = ('scale',)
+    
+    def __init__(self, scale):
+        self.scale = scale
+    
+    def get_value(self):
+        return _exp(self.scale.get_value())
 
 
 class CustomizeDialog(Gtk.Dialog):
     """Unified customization dialog with GNOME-style sidebar"""
     
+    # Decoded theme previews shared across dialog opens: path -> (mtime_ns, pixbuf)
+    _preview_cache = OrderedDict()
+    PREVIEW_CACHE_SIZE = 32
+    
+    # Theme previews are rendered, stored and displayed at this size (FlowBox cell size)
+    PREVIEW_SIZE = 200
+    
+    # Shared CssProviders for DIALOG_CSS and PICKER_CSS, created on first use
+    _css_provider = None
+    _picker_css_provider = None
+    
+    # Picker directory listings shared across dialog opens, rescanned when the
+    # directory's mtime changes: path -> (mtime_ns, names)
+    _dir_index = {}
+    # Resolved hand set images: hand_dir -> ((dir, processed, original mtimes), paths)
+    _hand_set_paths_cache = {}
+    
+    # Picker thumbnails shared across dialog opens: (path, mtime_ns, width, height) -> pixbuf
+    _thumbnail_cache = OrderedDict()
+    THUMBNAIL_CACHE_SIZE = 256
+    # Files kept in the on-disk thumbnail cache; least recently used ones are
+    # pruned beyond this whenever a picker opens
+    THUMBNAIL_DISK_CACHE_SIZE = 1024
+    
+    # Natural height of the Clock Face page, measured the first time it is built
+    _clock_face_height = None
+    
+    # Worker threads decoding preview PNGs (GdkPixbuf only, never GTK), created on first use
+    _decode_executor = None
+    
     def __init__(self, parent):
         # Set title with theme name
         title = f"Clock Settings - {parent.theme.name}"
@@ -38,28 +243,96 @@ class CustomizeDialog(Gtk.Dialog):
         
         self.parent_clock = parent
         
-        # Add CSS for subtle FlowBox selection color
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            flowboxchild:selected {
-                background-color: rgba(100, 150, 200, 0.15);
-                border: 2px solid rgba(100, 150, 200, 0.3);
-            }
-        """)
-        screen = self.get_screen()
-        style_context = Gtk.StyleContext()
-        style_context.add_provider_for_screen(screen, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        # Add CSS for subtle FlowBox selection color (once per screen, not per dialog)
+        if CustomizeDialog._css_provider is None:
+            CustomizeDialog._css_provider = Gtk.CssProvider()
+            CustomizeDialog._css_provider.load_from_data(DIALOG_CSS)
+            Gtk.StyleContext.add_provider_for_screen(self.get_screen(), CustomizeDialog._css_provider,
+                                                     Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
         
         # Store single in-memory preview for current theme
         self.in_memory_preview_pixbuf = None
+        # Second hand visibility for preview renders, kept in step by on_show_seconds_toggled
+        self._cached_show_seconds = self.parent_clock.settings.get('show_second_hand')
+        
+        # Controls refreshed by _update_controls_from_clock, registered as pages are built
+        self._control_bindings = []
+        
+        # Scratch opaque color reused by _tuple_to_rgba for every set_rgba call
+        self._rgba_scratch = Gdk.RGBA(0.0, 0.0, 0.0, 1.0)
+        
+        # Resolved on first use by the hex copy buttons
+        self._clipboard = None
+        
+        # Pending idle sources for coalesced preview regeneration and clock redraws
+        self._preview_source = None
+        self._redraw_source = None
+        # Pending trailing settings save while the clock size slider is dragged
+        self._settings_save_source = None
+        # The edited theme's preview still needs rendering but the grid wasn't on screen
+        self._preview_pending = False
+        # Theme items currently showing a preview, least recently loaded first
+        # (theme_name -> FlowBoxChild), and the pending load pass
+        self._preview_lru = OrderedDict()
+        self._visible_previews_source = None
+        # Items waiting for their preview to be rendered (theme_name -> FlowBoxChild)
+        self._pending_generation = OrderedDict()
+        self._generation_source = None
+        # Previews being decoded on a worker thread (theme_name -> Future)
+        self._decoding = {}
+        # Theme name -> preview DirEntry, mtime_ns once known, or None if missing;
+        # rebuilt by _populate_themes
+        self._theme_dir_snapshot = {}
+        self._preview_dir_created = False
+        # PREVIEW_SIZE square surface every preview is rendered into; callers copy
+        # the pixels out (write_to_png / pixbuf_get_from_surface) before the next render
+        self._preview_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.PREVIEW_SIZE, self.PREVIEW_SIZE)
+        # Theme items by name, kept in step with the FlowBox
+        self._theme_children = {}
+        # Theme whose item label is currently bold
+        self._bold_theme_name = None
+        # Pending coalesced widget callbacks, key -> (timeout source, callback, widget)
+        # (see _debounce)
+        self._pending_updates = {}
+        # Hand controls currently laid out for 'image' or 'geometric' hands
+        self._hand_mode = None
+        self._width_sliders = {}
+        self._width_modes = {}
+        # Hidden tick sections still to be built, by kind -> (idle source, build)
+        self._deferred_tick_controls = {}
+        self.connect('destroy', self._on_destroy)
+        self.connect('map', self._on_map_render_pending_preview)
         
-        # LEFT SIDEBAR
-        sidebar = Gtk.ListBox()
-        sidebar.set_size_request(180, -1)
-        sidebar.get_style_context().add_class('sidebar')
+        # Create main horizontal box
+        main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
+        
+        # RIGHT CONTENT AREA with stack
+        self.stack = Gtk.Stack()
+        self.stack.set_transition_type(Gtk.StackTransitionType.CROSSFADE)
+        self.stack.set_transition_duration(150)
         
-        # Add sidebar items
-        self.sidebar_items = []
+        # Pages are built on first visit; only the Themes page is created up front.
+        # Each stack child is an empty slot the real page is packed into.
+        self._page_factories = {
+            "themes": self._create_themes_page,
+            "clock-face": self._create_clock_face_page,
+            "ticks": self._create_ticks_page,
+            "hands": self._create_hands_page,
+            "date-box": self._create_date_box_page,
+            "options": self._create_options_page,
+        }
+        # show_all() makes everything visible, so each page needs its
+        # conditional controls hidden again right after it is shown
+        self._page_visibility_updaters = {
+            "clock-face": (self._update_color_controls_visibility,
+                           self._update_texture_controls_visibility,
+                           self._update_number_controls_visibility),
+            "ticks": (self._update_hour_tick_controls_visibility,
+                      self._update_minute_tick_controls_visibility),
+            "hands": (self._update_hand_controls_visibility,),
+        }
+        self._pages_built = {}
+        self._page_slots = {}
         items = [
             ("Themes", "themes"),
             ("Clock Face", "clock-face"),
@@ -68,44 +341,19 @@ class CustomizeDialog(Gtk.Dialog):
             ("Date Box", "date-box"),
             ("Options", "options")
         ]
-        
         for label_text, page_id in items:
-            row = Gtk.ListBoxRow()
-            label = Gtk.Label(label=label_text)
-            label.set_halign(Gtk.Align.START)
-            label.set_margin_start(12)
-            label.set_margin_end(12)
-            label.set_margin_top(8)
-            label.set_margin_bottom(8)
-            row.add(label)
-            row.page_id = page_id
-            sidebar.add(row)
-            self.sidebar_items.append(row)
-        
-        sidebar.connect('row-selected', self.on_sidebar_changed)
-        
-        # Create main horizontal box
-        main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
+            slot = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            self._page_slots[page_id] = slot
+            self.stack.add_titled(slot, page_id, label_text)
         
-        # RIGHT CONTENT AREA with stack
-        self.stack = Gtk.Stack()
-        self.stack.set_transition_type(Gtk.StackTransitionType.CROSSFADE)
-        self.stack.set_transition_duration(150)
+        self._ensure_page("themes")
+        self.stack.set_visible_child_name("themes")
+        self.stack.connect('notify::visible-child-name', self._on_stack_page_changed)
         
-        # Add pages to stack
-        themes_page = self._create_themes_page()
-        clock_face_page = self._create_clock_face_page()
-        ticks_page = self._create_ticks_page()
-        hands_page = self._create_hands_page()
-        date_box_page = self._create_date_box_page()
-        options_page = self._create_options_page()
-        
-        self.stack.add_named(themes_page, "themes")
-        self.stack.add_named(clock_face_page, "clock-face")
-        self.stack.add_named(ticks_page, "ticks")
-        self.stack.add_named(hands_page, "hands")
-        self.stack.add_named(date_box_page, "date-box")
-        self.stack.add_named(options_page, "options")
+        # LEFT SIDEBAR, bound to the stack
+        sidebar = Gtk.StackSidebar()
+        sidebar.set_stack(self.stack)
+        sidebar.set_size_request(180, -1)
         
         # Pack sidebar and content (no scrolled window)
         main_box.pack_start(sidebar, False, False, 0)
@@ -117,50 +365,72 @@ class CustomizeDialog(Gtk.Dialog):
         box = self.get_content_area()
         box.pack_start(main_box, True, True, 0)
         
-        # Select first item
-        sidebar.select_row(self.sidebar_items[0])
-        
         # Show all widgets to get proper size requests
         self.show_all()
         
-        # Immediately update control visibility after show_all
-        # show_all() makes everything visible, so we need to hide the appropriate controls
-        self._update_color_controls_visibility()
-        self._update_texture_controls_visibility()
-        self._update_number_controls_visibility()
-        self._update_hour_tick_controls_visibility()
-        self._update_minute_tick_controls_visibility()
-        self._update_hand_controls_visibility()
-        # Force the widgets to actually hide by processing pending events
-        while Gtk.events_pending():
-            Gtk.main_iteration()
-        
-        # Calculate required height based on tallest page
-        pages = [themes_page, clock_face_page, ticks_page, hands_page, date_box_page, options_page]
-        max_height = 0
-        for page in pages:
-            nat_height = page.get_preferred_height()[1]  # Get natural height
-            if nat_height > max_height:
-                max_height = nat_height
+        # Size the dialog once GTK has settled the layout, instead of
+        # pumping the main loop here
+        GLib.idle_add(self._finalize_size, priority=GLib.PRIORITY_LOW)
+    
+    def _ensure_page(self, page_id):
+        """Build a stack page the first time it is needed"""
+        page = self._pages_built.get(page_id)
+        if page is None:
+            page = self._page_factories[page_id]()
+            self._pages_built[page_id] = page
+            self._page_slots[page_id].pack_start(page, True, True, 0)
+            page.show_all()
+            self.stack.freeze_child_notify()
+            try:
+                for update_visibility in self._page_visibility_updaters.get(page_id, ()):
+                    update_visibility()
+            finally:
+                self.stack.thaw_child_notify()
+            if page_id == 'clock-face' and CustomizeDialog._clock_face_height is None:
+                self._fit_height_to_clock_face()
+        return page
+    
+    def _finalize_size(self):
+        """Size and position the dialog for its tallest page (idle callback)"""
+        dialog_width = self._fit_height_to_clock_face()
+        
+        # Position dialog to the left and up to keep clock visible
+        parent_x, parent_y = self.parent_clock.get_position()
+        self.move(max(0, parent_x - dialog_width - 20), max(0, parent_y - 50))
+        return False
+    
+    def _fit_height_to_clock_face(self):
+        """Resize the dialog to fit the Clock Face page, the tallest one. Returns the width.
+        
+        The page is built lazily, so its height is remembered across dialogs once
+        measured; before that the Themes page (always built) stands in, and the
+        dialog is resized again when Clock Face is first built.
+        """
+        page = self._pages_built.get('clock-face')
+        if page is not None:
+            CustomizeDialog._clock_face_height = page.get_preferred_height()[1]  # Natural height
+        max_height = CustomizeDialog._clock_face_height
+        if max_height is None:
+            max_height = self._pages_built['themes'].get_preferred_height()[1]
         
         # Add extra space for dialog chrome (title bar, buttons, padding)
         dialog_chrome = 100
         total_height = max_height + dialog_chrome
         
-        # Set dialog size
+        # Set dialog size (already mapped by show_all, so resize rather than set_default_size)
         dialog_width = 950
         self.set_default_size(dialog_width, total_height)
-        
-        # Position dialog to the left and up to keep clock visible
-        parent_x, parent_y = parent.get_position()
-        self.move(max(0, parent_x - dialog_width - 20), max(0, parent_y - 50))
+        self.resize(dialog_width, total_height)
+        return dialog_width
     
-    def on_sidebar_changed(self, listbox, row):
-        if row:
-            # If switching to Themes tab and there are unsaved changes, regenerate preview
-            if row.page_id == 'themes' and self.parent_clock.theme.is_dirty:
-                self._regenerate_current_theme_preview()
-            self.stack.set_visible_child_name(row.page_id)
+    def _on_stack_page_changed(self, stack, pspec):
+        page_id = stack.get_visible_child_name()
+        if page_id is None:
+            return
+        # If switching to Themes tab and there are unsaved changes, regenerate preview
+        if page_id == 'themes' and self.parent_clock.theme.is_dirty:
+            self._regenerate_current_theme_preview()
+        self._ensure_page(page_id)
     
     def on_key_press(self, widget, event):
         """Handle Escape key to close dialog"""
@@ -264,7 +534,6 @@ class CustomizeDialog(Gtk.Dialog):
         
         if response == Gtk.ResponseType.OK and new_name:
             # Create duplicate theme
-            from theme import Theme
             new_theme = self.parent_clock.theme.duplicate(new_name)
             new_theme.save()
             
@@ -284,126 +553,34 @@ class CustomizeDialog(Gtk.Dialog):
     
     def _update_controls_from_clock(self):
         """Update all dialog controls to reflect current theme/settings state"""
+        # Only controls on pages that have been built are registered
         theme = self.parent_clock.theme
-        settings = self.parent_clock.settings
-        
-        # Clock Face controls
-        if hasattr(self, 'enable_color_check'):
-            self.enable_color_check.set_active(theme.get('enable_face_color'))
-        if hasattr(self, 'enable_texture_check'):
-            self.enable_texture_check.set_active(theme.get('enable_face_texture'))
-        if hasattr(self, 'background_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('background_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.background_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.background_color_button, 'hex_label'):
-                self.background_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'rim_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('rim_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.rim_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.rim_color_button, 'hex_label'):
-                self.rim_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'face_texture_label'):
-            self.face_texture_label.set_text(self._format_texture_label(theme.get('face_texture_name')))
-        
-        # Ticks controls
-        if hasattr(self, 'hour_tick_style_combo'):
-            self.hour_tick_style_combo.set_active_id(theme.get('hour_tick_style'))
-        if hasattr(self, 'minute_tick_style_combo'):
-            self.minute_tick_style_combo.set_active_id(theme.get('minute_tick_style'))
-        if hasattr(self, 'ticks_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('ticks_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.ticks_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.ticks_color_button, 'hex_label'):
-                self.ticks_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'minute_ticks_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('minute_ticks_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.minute_ticks_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.minute_ticks_color_button, 'hex_label'):
-                self.minute_ticks_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'numbers_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('numbers_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.numbers_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.numbers_color_button, 'hex_label'):
-                self.numbers_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'number_font_button'):
-            self.number_font_button.set_font(theme.get('number_font'))
-        if hasattr(self, 'number_bold_switch'):
-            self.number_bold_switch.set_active(theme.get('number_bold'))
-        if hasattr(self, 'roman_numerals_switch'):
-            self.roman_numerals_switch.set_active(theme.get('use_roman_numerals'))
-        if hasattr(self, 'cardinal_numbers_switch'):
-            self.cardinal_numbers_switch.set_active(theme.get('show_cardinal_numbers_only'))
-        if hasattr(self, 'show_numbers_switch'):
-            self.show_numbers_switch.set_active(theme.get('show_numbers'))
-        if hasattr(self, 'show_hour_ticks_switch'):
-            self.show_hour_ticks_switch.set_active(theme.get('show_hour_ticks'))
-        if hasattr(self, 'show_minute_ticks_switch'):
-            self.show_minute_ticks_switch.set_active(theme.get('show_minute_ticks'))
-        
-        # Hands controls
-        if hasattr(self, 'hands_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('hands_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.hands_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.hands_color_button, 'hex_label'):
-                self.hands_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'second_hand_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('second_hand_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.second_hand_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.second_hand_color_button, 'hex_label'):
-                self.second_hand_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'minute_hand_snap_switch'):
-            self.minute_hand_snap_switch.set_active(settings.get('minute_hand_snap'))
-        
-        # Update hand theme label
-        if hasattr(self, 'hand_theme_label'):
-            self.hand_theme_label.set_text(self._format_hand_theme_label())
-        
-        # Update hand controls visibility based on new theme's hand image settings
-        if hasattr(self, 'hour_width_scale'):
-            self._update_hand_controls_visibility()
-        
-        # Date box controls
-        if hasattr(self, 'date_text_color_button'):
-            rgba = Gdk.RGBA()
-            color = theme.get('date_text_color')
-            rgba.red, rgba.green, rgba.blue = color
-            rgba.alpha = 1.0
-            self.date_text_color_button.set_rgba(rgba)
-            # Update hex label if it exists
-            if hasattr(self.date_text_color_button, 'hex_label'):
-                self.date_text_color_button.hex_label.set_text(self._color_to_hex(color))
-        if hasattr(self, 'date_font_button'):
-            self.date_font_button.set_font(theme.get('date_font'))
-        if hasattr(self, 'date_bold_switch'):
-            self.date_bold_switch.set_active(theme.get('date_bold'))
+        for update in self._control_bindings:
+            update(theme)
+    
+    def _bind_control(self, update):
+        """Register update(theme) to refresh a control when the theme changes under it"""
+        self._control_bindings.append(update)
+    
+    def _bind_color_button(self, button, key):
+        """Register a color button (and its hex label) for theme refreshes"""
+        def update(theme):
+            # color-set is only emitted on user choice, so set_rgba doesn't feed
+            # back into the change handlers
+            color = theme.get(key)
+            button.set_rgba(self._tuple_to_rgba(color))
+            button.hex_label.set_text(_color_to_hex(color))
+        self._control_bindings.append(update)
+    
+    def _bind_switch(self, switch, key):
+        """Drive a switch from a boolean theme key: initial state, changes and theme refreshes"""
+        switch.set_active(self.parent_clock.theme.get(key))
+        switch.connect("notify::active", self._on_theme_switch_toggled, key)
+        self._bind_control(lambda theme: switch.set_active(theme.get(key)))
+    
+    def _on_theme_switch_toggled(self, switch, gparam, key):
+        """Shared notify::active handler for switches registered with _bind_switch"""
+        self._on_theme_property_changed(key, switch.get_active())
     
     def _mark_dirty(self):
         """Update save button based on theme dirty state"""
@@ -413,15 +590,91 @@ class CustomizeDialog(Gtk.Dialog):
     def _on_theme_property_changed(self, property_name, value):
         """Generic handler for theme property changes"""
         self.parent_clock.theme.set(property_name, value)
+        self._invalidate_theme()
+    
+    def _invalidate_theme(self):
+        """Reflect an edit of the current theme: save button, clock and preview.
+        
+        The redraw and preview regeneration are coalesced, so handlers that
+        set several keys for one user action can call this once per key.
+        """
         self._mark_dirty()
-        self._regenerate_current_theme_preview()
+        self._queue_preview()
+    
+    def _queue_preview(self):
+        """Redraw the clock now and regenerate the preview at most once per ~2 frames"""
+        self._queue_clock_redraw()
+        if self._preview_source is None:
+            # An idle would still fire on every motion event while a slider is dragged
+            self._preview_source = GLib.timeout_add(33, self._flush_preview)
+    
+    def _flush_preview(self):
+        self._preview_source = None
+        # Controls refreshed from a freshly loaded theme echo its values back; a
+        # clean theme's preview is the one on disk, so there is nothing to render
+        if self.parent_clock.theme.is_dirty:
+            self._regenerate_current_theme_preview()
+        return False
+    
+    def _queue_clock_redraw(self):
+        """Invalidate the clock once for a burst of changes, ahead of GTK's own redraw"""
+        if self._redraw_source is None:
+            self._redraw_source = GLib.idle_add(self._flush_clock_redraw, priority=GLib.PRIORITY_HIGH_IDLE + 20)
+    
+    def _flush_clock_redraw(self):
+        self._redraw_source = None
         self.parent_clock.queue_draw()
+        return False
+    
+    def _on_destroy(self, widget):
+        """Drop pending idle work so it doesn't run against destroyed widgets"""
+        # Deliver the last change of a drag or color pick instead of losing it; the
+        # widgets are still alive while destroy handlers run
+        pending, self._pending_updates = self._pending_updates, {}
+        for source_id, callback, control in pending.values():
+            GLib.source_remove(source_id)
+            callback(control)
+        if self._preview_source is not None:
+            GLib.source_remove(self._preview_source)
+            self._preview_source = None
+        if self._visible_previews_source is not None:
+            GLib.source_remove(self._visible_previews_source)
+            self._visible_previews_source = None
+        if self._generation_source is not None:
+            GLib.source_remove(self._generation_source)
+            self._generation_source = None
+        # Decodes still in flight find themselves gone and drop their result
+        self._decoding.clear()
+        # A texture picked but not drawn yet shouldn't keep its pixbuf alive
+        self.parent_clock.cancel_texture_preload()
+        if self._redraw_source is not None:
+            # The clock outlives the dialog, so still deliver its redraw
+            GLib.source_remove(self._redraw_source)
+            self._flush_clock_redraw()
+        if self._settings_save_source is not None:
+            GLib.source_remove(self._settings_save_source)
+            self._flush_settings_save()
+        for source_id, build in self._deferred_tick_controls.values():
+            GLib.source_remove(source_id)
+        self._deferred_tick_controls.clear()
     
     def _on_settings_property_changed(self, property_name, value):
         """Generic handler for settings property changes"""
         self.parent_clock.settings.set(property_name, value)
         self.parent_clock.settings.save()
-        self.parent_clock.queue_draw()
+        self._queue_clock_redraw()
+    
+    def _queue_settings_save(self, delay_ms=200):
+        """Save settings delay_ms after the last of a burst of changes, restarting
+        the wait on each one, so a slider drag writes the file once"""
+        if self._settings_save_source is not None:
+            GLib.source_remove(self._settings_save_source)
+        self._settings_save_source = GLib.timeout_add(delay_ms, self._flush_settings_save)
+    
+    def _flush_settings_save(self):
+        self._settings_save_source = None
+        self.parent_clock.settings.save()
+        return False
     
     
     def _create_themes_page(self):
@@ -435,9 +688,7 @@ class CustomizeDialog(Gtk.Dialog):
         # Header with Save Theme As button
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         
-        label = Gtk.Label(label="<b>Available Themes</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Available Themes</b>", markup=True)
         header_box.pack_start(label, False, False, 0)
         
         save_as_themes_button = Gtk.Button(label="Save theme as...")
@@ -455,6 +706,7 @@ class CustomizeDialog(Gtk.Dialog):
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_min_content_height(400)
+        self.themes_scrolled = scrolled
         
         self.themes_flow = Gtk.FlowBox()
         self.themes_flow.set_max_children_per_line(4)
@@ -465,6 +717,11 @@ class CustomizeDialog(Gtk.Dialog):
         self.themes_flow.connect('child-activated', self.on_theme_activated)
         self.themes_flow.connect('selected-children-changed', self.on_theme_selection_changed)
         
+        # Previews are only decoded for items in view
+        self.themes_flow.connect('size-allocate', self._queue_visible_previews)
+        self.themes_flow.connect('map', self._on_map_render_pending_preview)
+        scrolled.get_vadjustment().connect('value-changed', self._queue_visible_previews)
+        
         scrolled.add(self.themes_flow)
         box.pack_start(scrolled, True, True, 0)
         
@@ -475,7 +732,10 @@ class CustomizeDialog(Gtk.Dialog):
     
     def _create_clock_face_page(self):
         """Create Clock Face customization page"""
+        theme = self.parent_clock.theme
         grid = Gtk.Grid()
+        # Hold child-property notifications until the page is fully built
+        grid.freeze_child_notify()
         grid.set_column_spacing(12)
         grid.set_row_spacing(12)
         grid.set_margin_start(24)
@@ -486,9 +746,7 @@ class CustomizeDialog(Gtk.Dialog):
         row = 0
         
         # Overall Size Section
-        label = Gtk.Label(label="<b>Overall Size</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Overall Size</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
@@ -501,77 +759,32 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Color Section
-        label = Gtk.Label(label="<b>Color</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Color</b>", markup=True)
         grid.attach(label, 0, row, 1, 1)
         
         # Enable Color checkbox
         self.enable_color_check = Gtk.CheckButton(label="Enable")
-        self.enable_color_check.set_active(self.parent_clock.theme.get('enable_face_color'))
+        self.enable_color_check.set_active(theme.get('enable_face_color'))
         self.enable_color_check.set_halign(Gtk.Align.END)
         self.enable_color_check.connect('toggled', self.on_enable_color_toggled)
+        self._bind_control(lambda theme, w=self.enable_color_check: w.set_active(theme.get('enable_face_color')))
         grid.attach(self.enable_color_check, 1, row, 1, 1)
         row += 1
 
         self.face_color_controls = []
         
         # Background color
-        bg_label = Gtk.Label(label="Background:")
-        bg_label.set_halign(Gtk.Align.START)
-        grid.attach(bg_label, 0, row, 1, 1)
-        
-        # Create horizontal box for button, hex label, and copy button
-        bg_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        
-        self.background_color_button = Gtk.ColorButton()
-        self.background_color_button.set_use_alpha(False)
-        bg_color = self.parent_clock.theme.get('background_color')
-        self.background_color_button.set_rgba(self._tuple_to_rgba(bg_color))
-        self.background_color_button.set_halign(Gtk.Align.START)
-        bg_hbox.pack_start(self.background_color_button, False, False, 0)
-        
-        # Add hex value label
-        bg_hex_label = Gtk.Label()
-        bg_hex_label.set_text(self._color_to_hex(bg_color))
-        bg_hex_label.set_selectable(True)
-        bg_hex_label.set_halign(Gtk.Align.START)
-        bg_hex_label.get_style_context().add_class("monospace")
-        bg_hbox.pack_start(bg_hex_label, False, False, 0)
-        self.background_color_button.hex_label = bg_hex_label
-        
-        # Add copy button
-        bg_copy_button = Gtk.Button()
-        bg_copy_button.set_label("📋")
-        bg_copy_button.set_tooltip_text("Copy to clipboard")
-        bg_copy_button.set_relief(Gtk.ReliefStyle.NONE)
-        bg_copy_button.connect("clicked", lambda btn: Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD).set_text(bg_hex_label.get_text(), -1))
-        bg_hbox.pack_start(bg_copy_button, False, False, 0)
-        
-        def bg_color_callback(button):
-            rgba = button.get_rgba()
-            color = (rgba.red, rgba.green, rgba.blue)
-            button.hex_label.set_text(self._color_to_hex(color))
-            self.on_background_color_changed(button)
-        
-        self.background_color_button.connect("color-set", bg_color_callback)
-        grid.attach(bg_hbox, 1, row, 1, 1)
-        self.face_color_controls.extend([bg_label, bg_hbox])
+        bg_widgets = self._add_color_button(grid, row, "Background:", theme.get('background_color'),
+                              self.on_background_color_changed)
+        self.background_color_button = bg_widgets[2]
+        self._bind_color_button(self.background_color_button, 'background_color')
+        self.face_color_controls.extend(bg_widgets[:2])
         row += 1
 
         # Color Opacity slider
-        color_opacity_label = Gtk.Label(label="Opacity:")
-        color_opacity_label.set_halign(Gtk.Align.START)
-        grid.attach(color_opacity_label, 0, row, 1, 1)
-        color_opacity_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.0, 1.0, 0.01)
-        color_opacity_scale.set_value(self.parent_clock.theme.get('face_color_opacity'))
-        color_opacity_scale.set_hexpand(True)
-        color_opacity_scale.set_size_request(400, -1)
-        color_opacity_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        color_opacity_scale.set_digits(2)
-        color_opacity_scale.connect("value-changed", self.on_face_color_opacity_changed)
-        grid.attach(color_opacity_scale, 1, row, 1, 1)
-        self.face_color_controls.extend([color_opacity_label, color_opacity_scale])
+        color_opacity_widgets = self._add_slider(grid, row, "Opacity:", theme.get('face_color_opacity'),
+                                                 0.0, 1.0, self.on_face_color_opacity_changed, step=0.01, digits=2)
+        self.face_color_controls.extend(color_opacity_widgets)
         row += 1
 
         # Separator
@@ -579,27 +792,26 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Texture Section
-        label = Gtk.Label(label="<b>Texture</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Texture</b>", markup=True)
         grid.attach(label, 0, row, 1, 1)
         
         # Enable Texture checkbox
         self.enable_texture_check = Gtk.CheckButton(label="Enable")
-        self.enable_texture_check.set_active(self.parent_clock.theme.get('enable_face_texture'))
+        self.enable_texture_check.set_active(theme.get('enable_face_texture'))
         self.enable_texture_check.set_halign(Gtk.Align.END)
         self.enable_texture_check.connect('toggled', self.on_enable_texture_toggled)
+        self._bind_control(lambda theme, w=self.enable_texture_check: w.set_active(theme.get('enable_face_texture')))
         grid.attach(self.enable_texture_check, 1, row, 1, 1)
         row += 1
 
         self.face_texture_controls = []
         
         # Texture selection
-        texture_label = Gtk.Label(label="Texture:")
-        texture_label.set_halign(Gtk.Align.START)
+        texture_label = self._mklabel("Texture:")
         grid.attach(texture_label, 0, row, 1, 1)
-        self.face_texture_label = Gtk.Label(label=self._format_texture_label(self.parent_clock.theme.get('face_texture_name')))
-        self.face_texture_label.set_halign(Gtk.Align.START)
+        self.face_texture_label = self._mklabel(self._format_texture_label(theme.get('face_texture_name')))
+        self._bind_control(lambda theme, w=self.face_texture_label:
+                           w.set_text(self._format_texture_label(theme.get('face_texture_name'))))
         grid.attach(self.face_texture_label, 1, row, 1, 1)
         self.face_texture_controls.extend([texture_label, self.face_texture_label])
         row += 1
@@ -612,18 +824,9 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Texture Opacity slider
-        texture_opacity_label = Gtk.Label(label="Opacity:")
-        texture_opacity_label.set_halign(Gtk.Align.START)
-        grid.attach(texture_opacity_label, 0, row, 1, 1)
-        texture_opacity_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.0, 1.0, 0.01)
-        texture_opacity_scale.set_value(self.parent_clock.theme.get('face_texture_opacity'))
-        texture_opacity_scale.set_hexpand(True)
-        texture_opacity_scale.set_size_request(400, -1)
-        texture_opacity_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        texture_opacity_scale.set_digits(2)
-        texture_opacity_scale.connect("value-changed", self.on_face_texture_opacity_changed)
-        grid.attach(texture_opacity_scale, 1, row, 1, 1)
-        self.face_texture_controls.extend([texture_opacity_label, texture_opacity_scale])
+        texture_opacity_widgets = self._add_slider(grid, row, "Opacity:", theme.get('face_texture_opacity'),
+                                                   0.0, 1.0, self.on_face_texture_opacity_changed, step=0.01, digits=2)
+        self.face_texture_controls.extend(texture_opacity_widgets)
         row += 1
 
         # Separator
@@ -631,20 +834,19 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Rim Section
-        label = Gtk.Label(label="<b>Rim</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Rim</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
-        self._add_slider(grid, row, "Thickness:", self.parent_clock.theme.get('rim_width'), 0.0, 0.05, self.on_rim_width_changed)
+        self._add_slider(grid, row, "Thickness:", theme.get('rim_width'), 0.0, 0.05, self.on_rim_width_changed)
         row += 1
         
-        self._add_slider(grid, row, "Opacity:", self.parent_clock.theme.get('rim_opacity'), 0.0, 1.0, self.on_rim_opacity_changed)
+        self._add_slider(grid, row, "Opacity:", theme.get('rim_opacity'), 0.0, 1.0, self.on_rim_opacity_changed)
         row += 1
         
-        rim_color_widgets = self._add_color_button(grid, row, "Color:", self.parent_clock.theme.get('rim_color'), self.on_rim_color_changed)
-        self.rim_color_button = rim_color_widgets[1]
+        rim_color_widgets = self._add_color_button(grid, row, "Color:", theme.get('rim_color'), self.on_rim_color_changed)
+        self.rim_color_button = rim_color_widgets[2]
+        self._bind_color_button(self.rim_color_button, 'rim_color')
         row += 1
 
         # Separator
@@ -652,21 +854,19 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Numbers Section
-        label = Gtk.Label(label="<b>Numbers</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Numbers</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
         # Show numbers checkbox
-        label = Gtk.Label(label="Show numbers:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Show numbers:")
         grid.attach(label, 0, row, 1, 1)
         
         self.show_numbers_switch = Gtk.Switch()
-        self.show_numbers_switch.set_active(self.parent_clock.theme.get('show_numbers'))
+        self.show_numbers_switch.set_active(theme.get('show_numbers'))
         self.show_numbers_switch.set_halign(Gtk.Align.START)
         self.show_numbers_switch.connect("notify::active", self.on_show_numbers_toggled)
+        self._bind_control(lambda theme, w=self.show_numbers_switch: w.set_active(theme.get('show_numbers')))
         grid.attach(self.show_numbers_switch, 1, row, 1, 1)
         row += 1
         
@@ -674,10 +874,10 @@ class CustomizeDialog(Gtk.Dialog):
         self.number_controls = []
         
         # Determine initial visibility
-        numbers_visible = self.parent_clock.theme.get('show_numbers')
+        numbers_visible = theme.get('show_numbers')
         
         # Position slider
-        position_widgets = self._add_slider(grid, row, "Position:", self.parent_clock.theme.get('number_position'), 0.65, 0.95,
+        position_widgets = self._add_slider(grid, row, "Position:", theme.get('number_position'), 0.65, 0.95,
                         self.on_number_position_changed)
         for widget in position_widgets:
             widget.set_visible(numbers_visible)
@@ -685,7 +885,7 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Size slider
-        size_widgets = self._add_slider(grid, row, "Size:", self.parent_clock.theme.get('number_size'), 0.05, 0.25,
+        size_widgets = self._add_slider(grid, row, "Size:", theme.get('number_size'), 0.05, 0.25,
                         self.on_number_size_changed)
         for widget in size_widgets:
             widget.set_visible(numbers_visible)
@@ -693,65 +893,20 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Color button
-        color_label = Gtk.Label(label="Color:")
-        color_label.set_halign(Gtk.Align.START)
-        color_label.set_visible(numbers_visible)
-        self.number_controls.append(color_label)
-        grid.attach(color_label, 0, row, 1, 1)
-        
-        # Create horizontal box for button, hex label, and copy button
-        numbers_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        numbers_hbox.set_visible(numbers_visible)
-        
-        numbers_color_button = Gtk.ColorButton()
-        numbers_color_button.set_use_alpha(False)
-        numbers_color = self.parent_clock.theme.get('numbers_color')
-        rgba = Gdk.RGBA()
-        rgba.red, rgba.green, rgba.blue = numbers_color
-        rgba.alpha = 1.0
-        numbers_color_button.set_rgba(rgba)
-        numbers_color_button.set_halign(Gtk.Align.START)
-        numbers_color_button.set_hexpand(False)
-        numbers_hbox.pack_start(numbers_color_button, False, False, 0)
-        
-        # Add hex value label
-        numbers_hex_label = Gtk.Label()
-        numbers_hex_label.set_text(self._color_to_hex(numbers_color))
-        numbers_hex_label.set_selectable(True)
-        numbers_hex_label.set_halign(Gtk.Align.START)
-        numbers_hex_label.get_style_context().add_class("monospace")
-        numbers_hbox.pack_start(numbers_hex_label, False, False, 0)
-        numbers_color_button.hex_label = numbers_hex_label
-        
-        # Add copy button
-        numbers_copy_button = Gtk.Button()
-        numbers_copy_button.set_label("📋")
-        numbers_copy_button.set_tooltip_text("Copy to clipboard")
-        numbers_copy_button.set_relief(Gtk.ReliefStyle.NONE)
-        numbers_copy_button.connect("clicked", lambda btn: Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD).set_text(numbers_hex_label.get_text(), -1))
-        numbers_hbox.pack_start(numbers_copy_button, False, False, 0)
-        
-        def numbers_color_callback(button):
-            rgba = button.get_rgba()
-            color = (rgba.red, rgba.green, rgba.blue)
-            button.hex_label.set_text(self._color_to_hex(color))
-            self.on_numbers_color_changed(button)
-        
-        numbers_color_button.connect("color-set", numbers_color_callback)
-        self.number_controls.append(numbers_hbox)
-        self.numbers_color_button = numbers_color_button
-        grid.attach(numbers_hbox, 1, row, 1, 1)
+        numbers_color_widgets = self._add_color_button(grid, row, "Color:", theme.get('numbers_color'),
+                              self.on_numbers_color_changed, visible=numbers_visible)
+        self.number_controls.extend(numbers_color_widgets[:2])
+        self.numbers_color_button = numbers_color_widgets[2]
+        self._bind_color_button(self.numbers_color_button, 'numbers_color')
         row += 1
         
         # Font selection
-        font_label = Gtk.Label(label="Font:")
-        font_label.set_halign(Gtk.Align.START)
-        font_label.set_visible(numbers_visible)
+        font_label = self._mklabel("Font:", visible=numbers_visible)
         self.number_controls.append(font_label)
         grid.attach(font_label, 0, row, 1, 1)
         
         font_button = Gtk.FontButton()
-        font_button.set_font(self.parent_clock.theme.get('number_font'))
+        font_button.set_font(theme.get('number_font'))
         font_button.set_use_font(False)
         font_button.set_show_size(False)
         font_button.set_halign(Gtk.Align.START)
@@ -759,66 +914,61 @@ class CustomizeDialog(Gtk.Dialog):
         font_button.connect("font-set", self.on_number_font_changed)
         self.number_controls.append(font_button)
         self.number_font_button = font_button
+        self._bind_control(lambda theme, w=font_button: w.set_font(theme.get('number_font')))
         grid.attach(font_button, 1, row, 1, 1)
         row += 1
         
         # Bold switch
-        bold_label = Gtk.Label(label="Bold:")
-        bold_label.set_halign(Gtk.Align.START)
-        bold_label.set_visible(numbers_visible)
+        bold_label = self._mklabel("Bold:", visible=numbers_visible)
         self.number_controls.append(bold_label)
         grid.attach(bold_label, 0, row, 1, 1)
         
         bold_switch = Gtk.Switch()
-        bold_switch.set_active(self.parent_clock.theme.get('number_bold'))
         bold_switch.set_halign(Gtk.Align.START)
         bold_switch.set_visible(numbers_visible)
-        bold_switch.connect("notify::active", self.on_number_bold_toggled)
+        self._bind_switch(bold_switch, 'number_bold')
         self.number_controls.append(bold_switch)
         self.number_bold_switch = bold_switch
         grid.attach(bold_switch, 1, row, 1, 1)
         row += 1
         
         # Roman numerals switch
-        roman_label = Gtk.Label(label="Roman numerals:")
-        roman_label.set_halign(Gtk.Align.START)
-        roman_label.set_visible(numbers_visible)
+        roman_label = self._mklabel("Roman numerals:", visible=numbers_visible)
         self.number_controls.append(roman_label)
         grid.attach(roman_label, 0, row, 1, 1)
         
         roman_switch = Gtk.Switch()
-        roman_switch.set_active(self.parent_clock.theme.get('use_roman_numerals'))
         roman_switch.set_halign(Gtk.Align.START)
         roman_switch.set_visible(numbers_visible)
-        roman_switch.connect("notify::active", self.on_roman_numerals_toggled)
+        self._bind_switch(roman_switch, 'use_roman_numerals')
         self.number_controls.append(roman_switch)
         self.roman_numerals_switch = roman_switch
         grid.attach(roman_switch, 1, row, 1, 1)
         row += 1
         
         # Cardinal numbers only switch
-        cardinal_label = Gtk.Label(label="Cardinal numbers only:")
-        cardinal_label.set_halign(Gtk.Align.START)
-        cardinal_label.set_visible(numbers_visible)
+        cardinal_label = self._mklabel("Cardinal numbers only:", visible=numbers_visible)
         self.number_controls.append(cardinal_label)
         grid.attach(cardinal_label, 0, row, 1, 1)
         
         cardinal_switch = Gtk.Switch()
-        cardinal_switch.set_active(self.parent_clock.theme.get('show_cardinal_numbers_only'))
         cardinal_switch.set_halign(Gtk.Align.START)
         cardinal_switch.set_visible(numbers_visible)
-        cardinal_switch.connect("notify::active", self.on_cardinal_numbers_toggled)
+        self._bind_switch(cardinal_switch, 'show_cardinal_numbers_only')
         self.number_controls.append(cardinal_switch)
         self.cardinal_numbers_switch = cardinal_switch
         grid.attach(cardinal_switch, 1, row, 1, 1)
         row += 1
         
+        grid.thaw_child_notify()
         return grid
 
     
     def _create_ticks_page(self):
         """Create Ticks customization page"""
+        theme = self.parent_clock.theme
         grid = Gtk.Grid()
+        grid.freeze_child_notify()
         grid.set_column_spacing(12)
         grid.set_row_spacing(12)
         grid.set_margin_start(24)
@@ -829,13 +979,11 @@ class CustomizeDialog(Gtk.Dialog):
         row = 0
         
         # Tick Position (shared)
-        label = Gtk.Label(label="<b>Tick Position</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Tick Position</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
-        self._add_slider(grid, row, "Position:", self.parent_clock.theme.get('hour_tick_position'), 0.85, 0.99,
+        self._add_slider(grid, row, "Position:", theme.get('hour_tick_position'), 0.85, 0.99,
                         self.on_tick_position_changed)
         row += 1
         
@@ -844,302 +992,75 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Hour Ticks Section
-        label = Gtk.Label(label="<b>Hour Ticks</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Hour Ticks</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
         # Show hour ticks checkbox
-        label = Gtk.Label(label="Show hour ticks:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Show hour ticks:")
         grid.attach(label, 0, row, 1, 1)
         
         self.show_hour_ticks_switch = Gtk.Switch()
-        self.show_hour_ticks_switch.set_active(self.parent_clock.theme.get('show_hour_ticks'))
+        self.show_hour_ticks_switch.set_active(theme.get('show_hour_ticks'))
         self.show_hour_ticks_switch.set_halign(Gtk.Align.START)
         self.show_hour_ticks_switch.connect("notify::active", self.on_show_hour_ticks_toggled)
+        self._bind_control(lambda theme, w=self.show_hour_ticks_switch: w.set_active(theme.get('show_hour_ticks')))
         grid.attach(self.show_hour_ticks_switch, 1, row, 1, 1)
         row += 1
         
-        # Track hour tick controls for visibility management
+        # Hour tick style, size, shape and color rows. When hour ticks are off
+        # nothing in them is shown, so they are built after the page is up.
         self.hour_tick_controls = []
-        
-        # Determine initial visibility
-        hour_ticks_visible = self.parent_clock.theme.get('show_hour_ticks')
-        
-        # Hour tick style dropdown
-        label = Gtk.Label(label="Style:")
-        label.set_visible(hour_ticks_visible)
-        self.hour_tick_controls.append(label)
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 1, 1)
-        
-        self.style_combo = Gtk.ComboBoxText()
-        self.style_combo.append("square", "Square")
-        self.style_combo.append("round", "Round")
-        self.style_combo.append("rectangular", "Rectangular")
-        self.style_combo.set_active_id(self.parent_clock.theme.get('hour_tick_style'))
-        self.style_combo.set_halign(Gtk.Align.START)
-        self.style_combo.set_visible(hour_ticks_visible)
-        self.style_combo.connect("changed", self.on_hour_tick_style_changed)
-        self.hour_tick_controls.append(self.style_combo)
-        grid.attach(self.style_combo, 1, row, 1, 1)
-        row += 1
-        
-        # Size slider - track its widgets
-        size_label = Gtk.Label(label="Size:")
-        size_label.set_halign(Gtk.Align.START)
-        size_label.set_visible(hour_ticks_visible)
-        self.hour_tick_controls.append(size_label)
-        grid.attach(size_label, 0, row, 1, 1)
-        
-        size_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.01, 0.05, 0.001)
-        size_scale.set_value(self.parent_clock.theme.get('hour_tick_size'))
-        size_scale.set_hexpand(True)
-        size_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        size_scale.set_digits(3)
-        size_scale.set_visible(hour_ticks_visible)
-        size_scale.connect("value-changed", self.on_hour_tick_size_changed)
-        self.hour_tick_controls.append(size_scale)
-        grid.attach(size_scale, 1, row, 1, 1)
-        row += 1
-        
-        # Shape slider (only visible for rectangular style)
-        # Uses logarithmic scale: -2 to +2, where 0 = square (1.0)
-        # Negative = taller, Positive = wider
-        # Determine if shape should be visible (rectangular style AND hour ticks enabled)
-        is_rectangular = self.parent_clock.theme.get('hour_tick_style') == "rectangular"
-        shape_visible = hour_ticks_visible and is_rectangular
-        
-        self.shape_label = Gtk.Label(label="Shape:")
-        self.shape_label.set_halign(Gtk.Align.START)
-        self.shape_label.set_visible(shape_visible)
-        grid.attach(self.shape_label, 0, row, 1, 1)
-        
-        # Convert aspect ratio to log scale for slider
-        import math as m
-        current_ratio = self.parent_clock.theme.get('hour_tick_aspect_ratio')
-        slider_value = m.log2(current_ratio) if current_ratio > 0 else 0
-        
-        self.shape_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, -1.5, 1.5, 0.1)
-        self.shape_scale.set_value(slider_value)
-        self.shape_scale.set_hexpand(True)
-        self.shape_scale.set_size_request(400, -1)
-        self.shape_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        self.shape_scale.set_digits(1)
-        
-        # Add marks for reference
-        self.shape_scale.add_mark(0, Gtk.PositionType.BOTTOM, "Square")
-        self.shape_scale.add_mark(-1.5, Gtk.PositionType.BOTTOM, "Tall")
-        self.shape_scale.add_mark(1.5, Gtk.PositionType.BOTTOM, "Wide")
-        
-        self.shape_scale.set_visible(shape_visible)
-        self.shape_scale.connect("value-changed", self.on_hour_tick_shape_changed)
-        grid.attach(self.shape_scale, 1, row, 1, 1)
-        row += 1
-        
-        # Track shape widgets for visibility toggling
-        self.hour_tick_shape_widgets = [self.shape_label, self.shape_scale]
-        
-        # Color button - track its widgets
-        color_label = Gtk.Label(label="Color:")
-        color_label.set_halign(Gtk.Align.START)
-        color_label.set_visible(hour_ticks_visible)
-        self.hour_tick_controls.append(color_label)
-        grid.attach(color_label, 0, row, 1, 1)
-        
-        # Create horizontal box for button, hex label, and copy button
-        ticks_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        ticks_hbox.set_visible(hour_ticks_visible)
-        
-        ticks_color_button = Gtk.ColorButton()
-        ticks_color_button.set_use_alpha(False)
-        ticks_color = self.parent_clock.theme.get('ticks_color')
-        rgba = Gdk.RGBA()
-        rgba.red, rgba.green, rgba.blue = ticks_color
-        rgba.alpha = 1.0
-        ticks_color_button.set_rgba(rgba)
-        ticks_color_button.set_halign(Gtk.Align.START)
-        ticks_color_button.set_hexpand(False)
-        ticks_hbox.pack_start(ticks_color_button, False, False, 0)
-        
-        # Add hex value label
-        ticks_hex_label = Gtk.Label()
-        ticks_hex_label.set_text(self._color_to_hex(ticks_color))
-        ticks_hex_label.set_selectable(True)
-        ticks_hex_label.set_halign(Gtk.Align.START)
-        ticks_hex_label.get_style_context().add_class("monospace")
-        ticks_hbox.pack_start(ticks_hex_label, False, False, 0)
-        ticks_color_button.hex_label = ticks_hex_label
-        
-        # Add copy button
-        ticks_copy_button = Gtk.Button()
-        ticks_copy_button.set_label("📋")
-        ticks_copy_button.set_tooltip_text("Copy to clipboard")
-        ticks_copy_button.set_relief(Gtk.ReliefStyle.NONE)
-        ticks_copy_button.connect("clicked", lambda btn: Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD).set_text(ticks_hex_label.get_text(), -1))
-        ticks_hbox.pack_start(ticks_copy_button, False, False, 0)
-        
-        def ticks_color_callback(button):
-            rgba = button.get_rgba()
-            color = (rgba.red, rgba.green, rgba.blue)
-            button.hex_label.set_text(self._color_to_hex(color))
-            self.on_ticks_color_changed(button)
-        
-        ticks_color_button.connect("color-set", ticks_color_callback)
-        self.hour_tick_controls.append(ticks_hbox)
-        self.ticks_color_button = ticks_color_button
-        grid.attach(ticks_hbox, 1, row, 1, 1)
-        row += 1
+        self.hour_tick_shape_widgets = []
+        self.ticks_grid = grid
+        hour_row = row
+        row += 4
+        if theme.get('show_hour_ticks'):
+            self._build_hour_tick_controls(hour_row)
+        else:
+            self._defer_tick_controls('hour', lambda: self._build_hour_tick_controls(hour_row),
+                                      self._update_hour_tick_controls_visibility)
         
         # Separator
         grid.attach(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL), 0, row, 2, 1)
         row += 1
         
         # Minute Ticks Section
-        label = Gtk.Label(label="<b>Minute Ticks</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Minute Ticks</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
         # Show minute ticks checkbox
-        label = Gtk.Label(label="Show minute ticks:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Show minute ticks:")
         grid.attach(label, 0, row, 1, 1)
         
         self.show_minute_ticks_switch = Gtk.Switch()
-        self.show_minute_ticks_switch.set_active(self.parent_clock.theme.get('show_minute_ticks'))
+        self.show_minute_ticks_switch.set_active(theme.get('show_minute_ticks'))
         self.show_minute_ticks_switch.set_halign(Gtk.Align.START)
         self.show_minute_ticks_switch.connect("notify::active", self.on_show_minute_ticks_toggled)
+        self._bind_control(lambda theme, w=self.show_minute_ticks_switch: w.set_active(theme.get('show_minute_ticks')))
         grid.attach(self.show_minute_ticks_switch, 1, row, 1, 1)
         row += 1
         
-        # Track minute tick controls for visibility management
+        # Minute tick rows, deferred the same way as the hour tick rows
         self.minute_tick_controls = []
+        self.minute_tick_shape_widgets = []
+        minute_row = row
+        row += 4
+        if theme.get('show_minute_ticks'):
+            self._build_minute_tick_controls(minute_row)
+        else:
+            self._defer_tick_controls('minute', lambda: self._build_minute_tick_controls(minute_row),
+                                      self._update_minute_tick_controls_visibility)
         
-        # Determine initial visibility
-        minute_ticks_visible = self.parent_clock.theme.get('show_minute_ticks')
-        
-        # Minute tick style dropdown
-        label = Gtk.Label(label="Style:")
-        label.set_halign(Gtk.Align.START)
-        label.set_visible(minute_ticks_visible)
-        self.minute_tick_controls.append(label)
-        grid.attach(label, 0, row, 1, 1)
-        
-        self.minute_style_combo = Gtk.ComboBoxText()
-        self.minute_style_combo.set_visible(minute_ticks_visible)
-        self.minute_tick_controls.append(self.minute_style_combo)
-        self.minute_style_combo.append("square", "Square")
-        self.minute_style_combo.append("round", "Round")
-        self.minute_style_combo.append("rectangular", "Rectangular")
-        self.minute_style_combo.set_active_id(self.parent_clock.theme.get('minute_tick_style'))
-        self.minute_style_combo.set_halign(Gtk.Align.START)
-        self.minute_style_combo.connect("changed", self.on_minute_tick_style_changed)
-        grid.attach(self.minute_style_combo, 1, row, 1, 1)
-        row += 1
-        
-        # Track size slider widgets
-        size_widgets = self._add_slider(grid, row, "Size:", self.parent_clock.theme.get('minute_tick_size'), 0.01, 0.05,
-                        self.on_minute_tick_size_changed)
-        for widget in size_widgets:
-            widget.set_visible(minute_ticks_visible)
-        self.minute_tick_controls.extend(size_widgets)
-        row += 1
-        
-        # Minute shape slider (only visible for rectangular style)
-        # Determine if shape should be visible (rectangular style AND minute ticks enabled)
-        is_minute_rectangular = self.parent_clock.theme.get('minute_tick_style') == "rectangular"
-        minute_shape_visible = minute_ticks_visible and is_minute_rectangular
-        
-        self.minute_shape_label = Gtk.Label(label="Shape:")
-        self.minute_shape_label.set_halign(Gtk.Align.START)
-        self.minute_shape_label.set_visible(minute_shape_visible)
-        grid.attach(self.minute_shape_label, 0, row, 1, 1)
-        
-        # Convert aspect ratio to log scale for slider
-        import math as m
-        current_ratio = self.parent_clock.theme.get('minute_tick_aspect_ratio')
-        slider_value = m.log2(current_ratio) if current_ratio > 0 else 0
-        
-        self.minute_shape_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, -3.3, 1.5, 0.1)
-        self.minute_shape_scale.set_value(slider_value)
-        self.minute_shape_scale.set_hexpand(True)
-        self.minute_shape_scale.set_size_request(400, -1)
-        self.minute_shape_scale.set_value_pos(Gtk.PositionType.RIGHT)
-        self.minute_shape_scale.set_digits(1)
-        
-        # Add marks for reference
-        self.minute_shape_scale.add_mark(0, Gtk.PositionType.BOTTOM, "Square")
-        self.minute_shape_scale.add_mark(-3.3, Gtk.PositionType.BOTTOM, "Skinny")
-        self.minute_shape_scale.add_mark(1.5, Gtk.PositionType.BOTTOM, "Wide")
-        
-        self.minute_shape_scale.set_visible(minute_shape_visible)
-        self.minute_shape_scale.connect("value-changed", self.on_minute_tick_shape_changed)
-        grid.attach(self.minute_shape_scale, 1, row, 1, 1)
-        row += 1
-        
-        # Track shape widgets for visibility toggling
-        self.minute_tick_shape_widgets = [self.minute_shape_label, self.minute_shape_scale]
-        
-        # Color button
-        color_label = Gtk.Label(label="Color:")
-        color_label.set_halign(Gtk.Align.START)
-        color_label.set_visible(minute_ticks_visible)
-        self.minute_tick_controls.append(color_label)
-        grid.attach(color_label, 0, row, 1, 1)
-        
-        # Create horizontal box for button, hex label, and copy button
-        minute_ticks_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        minute_ticks_hbox.set_visible(minute_ticks_visible)
-        
-        minute_ticks_color_button = Gtk.ColorButton()
-        minute_ticks_color_button.set_use_alpha(False)
-        minute_ticks_color = self.parent_clock.theme.get('minute_ticks_color')
-        rgba = Gdk.RGBA()
-        rgba.red, rgba.green, rgba.blue = minute_ticks_color
-        rgba.alpha = 1.0
-        minute_ticks_color_button.set_rgba(rgba)
-        minute_ticks_color_button.set_halign(Gtk.Align.START)
-        minute_ticks_color_button.set_hexpand(False)
-        minute_ticks_hbox.pack_start(minute_ticks_color_button, False, False, 0)
-        
-        # Add hex value label
-        minute_ticks_hex_label = Gtk.Label()
-        minute_ticks_hex_label.set_text(self._color_to_hex(minute_ticks_color))
-        minute_ticks_hex_label.set_selectable(True)
-        minute_ticks_hex_label.set_halign(Gtk.Align.START)
-        minute_ticks_hex_label.get_style_context().add_class("monospace")
-        minute_ticks_hbox.pack_start(minute_ticks_hex_label, False, False, 0)
-        minute_ticks_color_button.hex_label = minute_ticks_hex_label
-        
-        # Add copy button
-        minute_ticks_copy_button = Gtk.Button()
-        minute_ticks_copy_button.set_label("📋")
-        minute_ticks_copy_button.set_tooltip_text("Copy to clipboard")
-        minute_ticks_copy_button.set_relief(Gtk.ReliefStyle.NONE)
-        minute_ticks_copy_button.connect("clicked", lambda btn: Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD).set_text(minute_ticks_hex_label.get_text(), -1))
-        minute_ticks_hbox.pack_start(minute_ticks_copy_button, False, False, 0)
-        
-        def minute_ticks_color_callback(button):
-            rgba = button.get_rgba()
-            color = (rgba.red, rgba.green, rgba.blue)
-            button.hex_label.set_text(self._color_to_hex(color))
-            self.on_minute_ticks_color_changed(button)
-        
-        minute_ticks_color_button.connect("color-set", minute_ticks_color_callback)
-        self.minute_tick_controls.append(minute_ticks_hbox)
-        self.minute_ticks_color_button = minute_ticks_color_button
-        grid.attach(minute_ticks_hbox, 1, row, 1, 1)
-        row += 1
-        
+        grid.thaw_child_notify()
         return grid
     
     def _create_hands_page(self):
         """Create Hands customization page"""
+        theme = self.parent_clock.theme
         grid = Gtk.Grid()
+        grid.freeze_child_notify()
         grid.set_column_spacing(12)
         grid.set_row_spacing(12)
         grid.set_margin_start(24)
@@ -1153,20 +1074,17 @@ class CustomizeDialog(Gtk.Dialog):
         row = 0
         
         # Hand Theme Section (applies to all hands)
-        label = Gtk.Label(label="<b>Hand Theme</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Hand Theme</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
         # Hand theme picker
-        label = Gtk.Label(label="Hand Images:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Hand Images:")
         grid.attach(label, 0, row, 1, 1)
         
         hand_theme_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        self.hand_theme_label = Gtk.Label(label=self._format_hand_theme_label())
-        self.hand_theme_label.set_halign(Gtk.Align.START)
+        self.hand_theme_label = self._mklabel(self._format_hand_theme_label())
+        self._bind_control(lambda theme: self._refresh_hand_labels())
         hand_theme_box.pack_start(self.hand_theme_label, False, False, 0)
         
         choose_hand_theme_button = Gtk.Button(label="Choose…")
@@ -1185,34 +1103,30 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Hour Hand Section
-        label = Gtk.Label(label="<b>Hour Hand</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Hour Hand</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
-        hour_length_widgets = self._add_slider(grid, row, "Length:", self.parent_clock.theme.get('hour_hand_length'), 0.3, 0.7,
+        hour_length_widgets = self._add_slider(grid, row, "Length:", theme.get('hour_hand_length'), 0.3, 0.7,
                         self.on_hour_hand_length_changed)
         self.hour_length_widgets = hour_length_widgets
         row += 1
         
-        hour_tail_widgets = self._add_slider(grid, row, "Tail:", self.parent_clock.theme.get('hour_hand_tail'), 0.0, 0.3,
+        hour_tail_widgets = self._add_slider(grid, row, "Tail:", theme.get('hour_hand_tail'), 0.0, 0.3,
                         self.on_hour_hand_tail_changed)
         self.hour_tail_widgets = hour_tail_widgets
         row += 1
         
-        # Width slider - will be dynamically configured based on mode (geometric vs image)
-        # Start with image mode defaults (logarithmic, 0.33-3.0)
-        hour_width_widgets = self._add_slider(grid, row, "Width:", 1.0, 0.33, 3.0,
-                        self.on_hour_hand_width_changed, logarithmic=True)
+        # Width slider - range is configured based on mode (geometric vs image)
+        hour_width_widgets = self._add_width_slider(grid, row, 'hour', self.on_hour_hand_width_changed)
         self.hour_width_widgets = hour_width_widgets
         self.hour_width_scale = hour_width_widgets[1]
-        self.hour_width_row = row  # Store row for potential slider replacement
         row += 1
         
-        hands_color_widgets = self._add_color_button(grid, row, "Color:", self.parent_clock.theme.get('hands_color'),
+        hands_color_widgets = self._add_color_button(grid, row, "Color:", theme.get('hands_color'),
                               self.on_hands_color_changed)
-        self.hands_color_button = hands_color_widgets[1]
+        self.hands_color_button = hands_color_widgets[2]
+        self._bind_color_button(self.hands_color_button, 'hands_color')
         self.hands_color_widgets = hands_color_widgets
         row += 1
         
@@ -1221,35 +1135,28 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Minute Hand Section
-        label = Gtk.Label(label="<b>Minute Hand</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Minute Hand</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
-        minute_length_widgets = self._add_slider(grid, row, "Length:", self.parent_clock.theme.get('minute_hand_length'), 0.5, 0.9,
+        minute_length_widgets = self._add_slider(grid, row, "Length:", theme.get('minute_hand_length'), 0.5, 0.9,
                         self.on_minute_hand_length_changed)
         self.minute_length_widgets = minute_length_widgets
         row += 1
         
-        minute_tail_widgets = self._add_slider(grid, row, "Tail:", self.parent_clock.theme.get('minute_hand_tail'), 0.0, 0.3,
+        minute_tail_widgets = self._add_slider(grid, row, "Tail:", theme.get('minute_hand_tail'), 0.0, 0.3,
                         self.on_minute_hand_tail_changed)
         self.minute_tail_widgets = minute_tail_widgets
         row += 1
         
-        # Width slider - will be dynamically configured based on mode (geometric vs image)
-        # Start with image mode defaults (logarithmic, 0.33-3.0)
-        minute_width_widgets = self._add_slider(grid, row, "Width:", 1.0, 0.33, 3.0,
-                        self.on_minute_hand_width_changed, logarithmic=True)
+        # Width slider - range is configured based on mode (geometric vs image)
+        minute_width_widgets = self._add_width_slider(grid, row, 'minute', self.on_minute_hand_width_changed)
         self.minute_width_widgets = minute_width_widgets
         self.minute_width_scale = minute_width_widgets[1]
-        self.minute_width_row = row  # Store row for potential slider replacement
         row += 1
         
         # Note: Minute hand uses same color as hour hand
-        label = Gtk.Label(label="(Uses same color as Hour Hand)")
-        label.set_halign(Gtk.Align.START)
-        label.get_style_context().add_class('dim-label')
+        label = self._mklabel("(Uses same color as Hour Hand)", dim=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
@@ -1258,34 +1165,32 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Second Hand Section
-        label = Gtk.Label(label="<b>Second Hand</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Second Hand</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
-        second_length_widgets = self._add_slider(grid, row, "Length:", self.parent_clock.theme.get('second_hand_length'), 0.5, 1.0,
+        second_length_widgets = self._add_slider(grid, row, "Length:", theme.get('second_hand_length'), 0.5, 1.0,
                         self.on_second_hand_length_changed)
         self.second_length_widgets = second_length_widgets
         row += 1
         
-        second_tail_widgets = self._add_slider(grid, row, "Tail:", self.parent_clock.theme.get('second_hand_tail'), 0.0, 0.4,
+        second_tail_widgets = self._add_slider(grid, row, "Tail:", theme.get('second_hand_tail'), 0.0, 0.4,
                         self.on_second_hand_tail_changed)
         self.second_tail_widgets = second_tail_widgets
         row += 1
         
-        # Width slider - will be dynamically configured based on mode (geometric vs image)
-        # Start with image mode defaults (logarithmic, 0.33-3.0)
-        second_width_widgets = self._add_slider(grid, row, "Width:", 1.0, 0.33, 3.0,
-                        self.on_second_hand_width_changed, logarithmic=True)
+        # Width slider - range is configured based on mode (geometric vs image)
+        second_width_widgets = self._add_width_slider(grid, row, 'second', self.on_second_hand_width_changed)
         self.second_width_widgets = second_width_widgets
         self.second_width_scale = second_width_widgets[1]
-        self.second_width_row = row  # Store row for potential slider replacement
         row += 1
         
-        second_hand_color_widgets = self._add_color_button(grid, row, "Color:", self.parent_clock.theme.get('second_hand_color'),
+        second_hand_color_widgets = self._add_color_button(grid, row, "Color:", theme.get('second_hand_color'),
                               self.on_second_hand_color_changed)
-        self.second_hand_color_button = second_hand_color_widgets[1]
+        self.second_hand_color_button = second_hand_color_widgets[2]
+        self._bind_color_button(self.second_hand_color_button, 'second_hand_color')
+        # Width slider ranges and tail visibility depend on the theme's hand images
+        self._bind_control(lambda theme: self._update_hand_controls_visibility(force=True))
         row += 1
         
         # Separator
@@ -1293,28 +1198,27 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Center Dot Section
-        label = Gtk.Label(label="<b>Center Dot</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Center Dot</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
-        self._add_slider(grid, row, "Size:", self.parent_clock.theme.get('center_dot_radius'), 0.01, 0.1,
+        self._add_slider(grid, row, "Size:", theme.get('center_dot_radius'), 0.01, 0.1,
                         self.on_center_dot_size_changed)
         row += 1
         
         # Note: Center dot uses same color as hands
-        label = Gtk.Label(label="(Uses same color as Hands)")
-        label.set_halign(Gtk.Align.START)
-        label.get_style_context().add_class('dim-label')
+        label = self._mklabel("(Uses same color as Hands)", dim=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
+        grid.thaw_child_notify()
         return grid
     
     def _create_date_box_page(self):
         """Create Date Box customization page"""
+        theme = self.parent_clock.theme
         grid = Gtk.Grid()
+        grid.freeze_child_notify()
         grid.set_column_spacing(12)
         grid.set_row_spacing(12)
         grid.set_margin_start(24)
@@ -1325,48 +1229,43 @@ class CustomizeDialog(Gtk.Dialog):
         row = 0
         
         # Date Box Section
-        label = Gtk.Label(label="<b>Date Box</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("<b>Date Box</b>", markup=True)
         grid.attach(label, 0, row, 2, 1)
         row += 1
         
-        self._add_slider(grid, row, "Width:", self.parent_clock.theme.get('date_box_width'), 0.4, 2.0,
+        self._add_slider(grid, row, "Width:", theme.get('date_box_width'), 0.4, 2.0,
                         self.on_date_box_width_changed)
         row += 1
         
-        self._add_slider(grid, row, "Height:", self.parent_clock.theme.get('date_box_height'), 0.1, 0.5,
+        self._add_slider(grid, row, "Height:", theme.get('date_box_height'), 0.1, 0.5,
                         self.on_date_box_height_changed)
         row += 1
         
-        self._add_slider(grid, row, "Margin:", self.parent_clock.theme.get('date_box_margin'), 0.0, 0.5,
+        self._add_slider(grid, row, "Margin:", theme.get('date_box_margin'), 0.0, 0.5,
                         self.on_date_box_margin_changed)
         row += 1
         
-        self._add_slider(grid, row, "Font Size:", self.parent_clock.theme.get('date_font_size'), 0.05, 0.2,
+        self._add_slider(grid, row, "Font Size:", theme.get('date_font_size'), 0.05, 0.2,
                         self.on_date_font_size_changed)
         row += 1
         
         # Date format selection
-        label = Gtk.Label(label="Format:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Format:")
         grid.attach(label, 0, row, 1, 1)
         
         # Generate examples using today's date
-        import datetime
-        today = datetime.datetime.now()
+        today = _datetime.now()
         
         self.date_format_combo = Gtk.ComboBoxText()
-        self.date_format_combo.append("%Y-%m-%d", today.strftime("%Y-%m-%d"))
-        self.date_format_combo.append("%d/%m/%Y", today.strftime("%d/%m/%Y"))
-        self.date_format_combo.append("%m/%d/%Y", today.strftime("%m/%d/%Y"))
-        self.date_format_combo.append("%B %d, %Y", today.strftime("%B %d, %Y"))
-        self.date_format_combo.append("%d %b %Y", today.strftime("%d %b %Y"))
-        self.date_format_combo.append("%A, %B %d", today.strftime("%A, %B %d"))
-        self.date_format_combo.append("%a %d %b", today.strftime("%a %d %b"))
+        self._date_format_handler = self.date_format_combo.connect("changed", self.on_date_format_changed)
+        
+        # Filling the combo and selecting the theme's format isn't a user change
+        self.date_format_combo.handler_block(self._date_format_handler)
+        for fmt in DATE_FORMATS:
+            self.date_format_combo.append(fmt, today.strftime(fmt))
         self.date_format_combo.append("custom", "Custom...")
         
-        current_format = self.parent_clock.theme.get('date_format')
+        current_format = theme.get('date_format')
         self.date_format_combo.set_active_id(current_format)
         if self.date_format_combo.get_active_id() is None:
             # Current format is custom
@@ -1374,9 +1273,9 @@ class CustomizeDialog(Gtk.Dialog):
             self.custom_date_format = current_format
         else:
             self.custom_date_format = None
+        self.date_format_combo.handler_unblock(self._date_format_handler)
         
         self.date_format_combo.set_halign(Gtk.Align.START)
-        self.date_format_combo.connect("changed", self.on_date_format_changed)
         
         # Create horizontal box for combo and edit button
         format_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -1392,189 +1291,134 @@ class CustomizeDialog(Gtk.Dialog):
         row += 1
         
         # Font selection
-        label = Gtk.Label(label="Font:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Font:")
         grid.attach(label, 0, row, 1, 1)
         
         date_font_button = Gtk.FontButton()
-        date_font_button.set_font(self.parent_clock.theme.get('date_font'))
+        date_font_button.set_font(theme.get('date_font'))
         date_font_button.set_use_font(False)
         date_font_button.set_show_size(False)
         date_font_button.set_halign(Gtk.Align.START)
         date_font_button.connect("font-set", self.on_date_font_changed)
+        self._bind_control(lambda theme, w=date_font_button: w.set_font(theme.get('date_font')))
         grid.attach(date_font_button, 1, row, 1, 1)
         row += 1
         
         # Bold checkbox
-        label = Gtk.Label(label="Bold:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Bold:")
         grid.attach(label, 0, row, 1, 1)
         
         date_bold_switch = Gtk.Switch()
-        date_bold_switch.set_active(self.parent_clock.theme.get('date_bold'))
         date_bold_switch.set_halign(Gtk.Align.START)
-        date_bold_switch.connect("notify::active", self.on_date_bold_toggled)
+        self._bind_switch(date_bold_switch, 'date_bold')
         grid.attach(date_bold_switch, 1, row, 1, 1)
         row += 1
         
         # Text color
-        date_text_color_widgets = self._add_color_button(grid, row, "Text Color:", self.parent_clock.theme.get('date_text_color'),
+        date_text_color_widgets = self._add_color_button(grid, row, "Text Color:", theme.get('date_text_color'),
                               self.on_date_text_color_changed)
-        self.date_text_color_button = date_text_color_widgets[1]
+        self.date_text_color_button = date_text_color_widgets[2]
+        self._bind_color_button(self.date_text_color_button, 'date_text_color')
         row += 1
         
+        grid.thaw_child_notify()
         return grid
     
     def _create_options_page(self):
         """Create Options page"""
-        grid = Gtk.Grid()
-        grid.set_column_spacing(12)
-        grid.set_row_spacing(12)
-        grid.set_margin_start(24)
-        grid.set_margin_end(24)
-        grid.set_margin_top(24)
-        grid.set_margin_bottom(24)
-        
-        row = 0
-        
-        # System Options Section
-        label = Gtk.Label(label="<b>System Options</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 2, 1)
-        row += 1
-        
-        # Auto Start checkbox
-        label = Gtk.Label(label="Auto Start on Logon:")
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 1, 1)
-        
-        autostart_switch = Gtk.Switch()
-        autostart_switch.set_active(self.parent_clock.is_autostart_enabled())
-        autostart_switch.set_halign(Gtk.Align.START)
-        autostart_switch.connect("notify::active", self.on_autostart_toggled)
-        grid.attach(autostart_switch, 1, row, 1, 1)
-        row += 1
-        
-        # Separator
-        grid.attach(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL), 0, row, 2, 1)
-        row += 1
-        
-        # Display Options Section
-        label = Gtk.Label(label="<b>Display Options</b>")
-        label.set_use_markup(True)
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 2, 1)
-        row += 1
-        
-        # Show Date checkbox
-        label = Gtk.Label(label="Show Date:")
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 1, 1)
-        
-        show_date_switch = Gtk.Switch()
-        show_date_switch.set_active(self.parent_clock.settings.get('show_date_box'))
-        show_date_switch.set_halign(Gtk.Align.START)
-        show_date_switch.connect("notify::active", self.on_show_date_toggled)
-        grid.attach(show_date_switch, 1, row, 1, 1)
-        row += 1
-        
-        # Show Seconds checkbox
-        label = Gtk.Label(label="Show Seconds:")
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 1, 1)
-        
-        show_seconds_switch = Gtk.Switch()
-        show_seconds_switch.set_active(self.parent_clock.settings.get('show_second_hand'))
-        show_seconds_switch.set_halign(Gtk.Align.START)
-        show_seconds_switch.connect("notify::active", self.on_show_seconds_toggled)
-        grid.attach(show_seconds_switch, 1, row, 1, 1)
-        row += 1
-        
-        # Snap Minute Hand checkbox
-        label = Gtk.Label(label="Snap Minute Hand:")
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 1, 1)
-        
-        snap_minute_switch = Gtk.Switch()
-        snap_minute_switch.set_active(self.parent_clock.settings.get('minute_hand_snap'))
-        snap_minute_switch.set_halign(Gtk.Align.START)
-        snap_minute_switch.connect("notify::active", self.on_minute_hand_snap_toggled)
-        grid.attach(snap_minute_switch, 1, row, 1, 1)
-        row += 1
-        
-        # Always on Top checkbox
-        label = Gtk.Label(label="Always on Top:")
-        label.set_halign(Gtk.Align.START)
-        grid.attach(label, 0, row, 1, 1)
+        builder = Gtk.Builder.new_from_string(_OPTIONS_PAGE_UI, -1)
+        settings = self.parent_clock.settings
         
-        always_on_top_switch = Gtk.Switch()
-        always_on_top_switch.set_active(self.parent_clock.settings.get('always_on_top'))
-        always_on_top_switch.set_halign(Gtk.Align.START)
-        always_on_top_switch.connect("notify::active", self.on_always_on_top_toggled_dialog)
-        grid.attach(always_on_top_switch, 1, row, 1, 1)
-        row += 1
+        # Set initial states before the handlers are connected
+        builder.get_object('autostart_switch').set_active(self.parent_clock.is_autostart_enabled())
+        builder.get_object('show_date_switch').set_active(settings.get('show_date_box'))
+        builder.get_object('show_seconds_switch').set_active(settings.get('show_second_hand'))
+        builder.get_object('snap_minute_switch').set_active(settings.get('minute_hand_snap'))
+        builder.get_object('always_on_top_switch').set_active(settings.get('always_on_top'))
+        builder.connect_signals(self)
         
-        return grid
+        return builder.get_object('grid')
     
     def _populate_themes(self):
-        """Populate the themes grid with available themes"""
-        # Save current selection
-        selected_theme_name = None
-        selected = self.themes_flow.get_selected_children()
-        if selected:
-            selected_theme_name = selected[0].theme_name
-        
-        # Clear existing items
-        for child in self.themes_flow.get_children():
-            self.themes_flow.remove(child)
-        
-        # Get all available themes using Theme class
-        from theme import Theme
-        available_themes = Theme.list_available_themes(self.parent_clock.themes_dir)
-        
-        # Add each theme
-        for theme_name in available_themes:
-            self._add_theme_item(theme_name)
-        
-        self.themes_flow.show_all()
-        
-        # Restore selection if the theme still exists
-        if selected_theme_name and selected_theme_name in available_themes:
-            for child in self.themes_flow.get_children():
-                if hasattr(child, 'theme_name') and child.theme_name == selected_theme_name:
-                    self.themes_flow.select_child(child)
-                    break
-    
-    def _add_theme_item(self, theme_name):
-        """Add a single theme item to the grid"""
+        """Bring the themes grid in line with the available themes"""
+        # Same names as Theme.list_available_themes, plus which previews exist
+        self._scan_theme_dirs()
+        available_themes = sorted(self._theme_dir_snapshot)
+        
+        # Only touch the items that changed; every add/remove re-lays out the
+        # whole FlowBox. Untouched items keep their selection and preview.
+        current = self._theme_children
+        for theme_name in current.keys() - self._theme_dir_snapshot.keys():
+            self.themes_flow.remove(current.pop(theme_name))
+            self._preview_lru.pop(theme_name, None)
+            self._decoding.pop(theme_name, None)
+        for position, theme_name in enumerate(available_themes):
+            if theme_name not in current:
+                self._add_theme_item(theme_name, position).show_all()
+        
+        # Move the bold highlight to the active theme
+        active_name = self.parent_clock.theme.name
+        if self._bold_theme_name != active_name:
+            old = current.get(self._bold_theme_name)
+            if old is not None:
+                old.name_label.set_text(old.theme_name)
+                # It may still show unsaved edits that were just discarded
+                if old.theme_name in self._preview_lru:
+                    self._unload_theme_item_preview(old)
+                    self._queue_visible_previews()
+            new = current.get(active_name)
+            if new is not None:
+                new.name_label.set_markup(f"<b>{active_name}</b>")
+            self._bold_theme_name = active_name
+    
+    def _scan_theme_dirs(self):
+        """Snapshot theme names and their preview's DirEntry (None if missing), one scandir per directory"""
+        snapshot = {'default': None}
+        previews = {}
+        try:
+            with os.scandir(self.parent_clock.themes_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith('.json'):
+                        snapshot.setdefault(name[:-5], None)
+                    elif name.endswith('.png') and entry.is_file(follow_symlinks=False):
+                        previews[name[:-4]] = entry
+        except OSError:
+            pass
+        for name in snapshot:
+            if name != 'default':
+                snapshot[name] = previews.get(name)
+        
+        # The default theme keeps its preview in the config dir
+        try:
+            with os.scandir(self.parent_clock.config_dir) as it:
+                for entry in it:
+                    if entry.name == 'default_preview.png' and entry.is_file(follow_symlinks=False):
+                        snapshot['default'] = entry
+        except OSError:
+            pass
+        self._theme_dir_snapshot = snapshot
+    
+    def _preview_mtime_ns(self, theme_name):
+        """mtime of a theme's existing preview, stat'ed at most once per snapshot"""
+        entry = self._theme_dir_snapshot[theme_name]
+        if not isinstance(entry, int):
+            entry = self._theme_dir_snapshot[theme_name] = entry.stat().st_mtime_ns
+        return entry
+    
+    def _add_theme_item(self, theme_name, position=-1):
+        """Insert a single theme item into the grid at position and return it"""
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         box.set_margin_top(6)
         box.set_margin_bottom(6)
         box.set_margin_start(6)
         box.set_margin_end(6)
         
-        # Preview image
+        # Preview image: a placeholder the size of the preview until the item
+        # scrolls into view (see _load_visible_previews)
         img = Gtk.Image()
-        preview_path = self._get_theme_preview_path(theme_name)
-        if os.path.exists(preview_path):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(preview_path, 200, 200, True)
-                img.set_from_pixbuf(pixbuf)
-            except Exception:
-                # Use placeholder if preview fails to load
-                img.set_from_icon_name('image-missing', Gtk.IconSize.DIALOG)
-        else:
-            # Generate preview if it doesn't exist
-            self._generate_theme_preview(theme_name)
-            if os.path.exists(preview_path):
-                try:
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(preview_path, 200, 200, True)
-                    img.set_from_pixbuf(pixbuf)
-                except Exception:
-                    img.set_from_icon_name('image-missing', Gtk.IconSize.DIALOG)
-            else:
-                img.set_from_icon_name('image-missing', Gtk.IconSize.DIALOG)
+        img.set_from_icon_name('image-x-generic', Gtk.IconSize.DIALOG)
+        img.set_size_request(self.PREVIEW_SIZE, self.PREVIEW_SIZE)
         
         # Theme name label
         label = Gtk.Label(label=theme_name)
@@ -1592,87 +1436,221 @@ class CustomizeDialog(Gtk.Dialog):
         child = Gtk.FlowBoxChild()
         child.add(box)
         child.theme_name = theme_name
-        self.themes_flow.add(child)
-    
-    def _get_theme_preview_path(self, theme_name):
-        """Get the path to a theme's preview image"""
-        if theme_name == 'default':
-            # Store default preview in config dir
-            return os.path.join(self.parent_clock.config_dir, 'default_preview.png')
-        return os.path.join(self.parent_clock.themes_dir, f"{theme_name}.png")
+        child.preview_path = self._get_theme_preview_path(theme_name)
+        child.name_label = label
+        child.image_widget = img
+        self.themes_flow.insert(child, position)
+        self._theme_children[theme_name] = child
+        return child
+    
+    def _queue_visible_previews(self, *args):
+        """Load previews for the items in view once scrolling/layout settles"""
+        if self._visible_previews_source is None:
+            self._visible_previews_source = GLib.idle_add(self._load_visible_previews,
+                                                          priority=GLib.PRIORITY_LOW)
+    
+    def _load_visible_previews(self):
+        """Decode (or generate) previews for theme items intersecting the viewport"""
+        self._visible_previews_source = None
+        vadjustment = self.themes_scrolled.get_vadjustment()
+        top = vadjustment.get_value()
+        bottom = top + vadjustment.get_page_size()
+        
+        for child in self._theme_children.values():
+            allocation = child.get_allocation()
+            visible = allocation.height > 1 and allocation.y + allocation.height >= top and allocation.y <= bottom
+            if child.theme_name in self._preview_lru:
+                if not visible:
+                    # Scrolled out of view: give the pixbuf back
+                    self._unload_theme_item_preview(child)
+            elif visible:
+                self._load_theme_item_preview(child)
+        return False
     
-    def _generate_theme_preview(self, theme_name):
-        """Generate a 200x200 preview image for a theme and save to disk"""
-        import cairo
-        from theme import Theme
-        
-        # Save current theme
-        saved_theme = self.parent_clock.theme
+    def _load_theme_item_preview(self, child):
+        """Show the preview image for one theme item, decoding it off the main loop if it isn't cached
+        and queueing it for generation if it doesn't exist"""
+        if not self._theme_dir_snapshot.get(child.theme_name):
+            self._queue_preview_generation(child)
+            return
+        if child.theme_name in self._decoding:
+            return
+        try:
+            mtime_ns = self._preview_mtime_ns(child.theme_name)
+        except OSError:
+            child.image_widget.set_from_icon_name('image-missing', Gtk.IconSize.DIALOG)
+            self._remember_preview(child)
+            return
+        
+        pixbuf = self._cached_preview_pixbuf(child.preview_path, mtime_ns)
+        if pixbuf is not None:
+            child.image_widget.set_from_pixbuf(pixbuf)
+            self._remember_preview(child)
+            return
         
-        # Load the theme temporarily
+        # Decode on a worker so a screenful of previews doesn't stall the main loop;
+        # straight to the cell size so oversized PNGs are never expanded in full
+        size = self.PREVIEW_SIZE
+        future = self._get_decode_executor().submit(GdkPixbuf.Pixbuf.new_from_file_at_scale,
+                                                    child.preview_path, size, size, True)
+        self._decoding[child.theme_name] = future
+        future.add_done_callback(
+            lambda future: GLib.idle_add(self._install_decoded_preview, child, mtime_ns, future))
+    
+    def _get_decode_executor(self):
+        """Worker pool shared by theme preview and picker thumbnail decodes"""
+        if CustomizeDialog._decode_executor is None:
+            CustomizeDialog._decode_executor = ThreadPoolExecutor(max_workers=4)
+        return CustomizeDialog._decode_executor
+    
+    def _install_decoded_preview(self, child, mtime_ns, future):
+        """Main-loop half of a worker decode: show the pixbuf and cache it"""
+        if self._decoding.get(child.theme_name) is not future:
+            # Dialog destroyed or item replaced meanwhile
+            return False
+        del self._decoding[child.theme_name]
+        try:
+            pixbuf = future.result()
+        except Exception:
+            # Use placeholder if preview fails to load
+            child.image_widget.set_from_icon_name('image-missing', Gtk.IconSize.DIALOG)
+        else:
+            self._store_preview_pixbuf(child.preview_path, mtime_ns, pixbuf)
+            child.image_widget.set_from_pixbuf(pixbuf)
+        self._remember_preview(child)
+        return False
+    
+    def _queue_preview_generation(self, child):
+        """Render a missing preview from an idle handler instead of blocking the caller"""
+        self._pending_generation[child.theme_name] = child
+        if self._generation_source is None:
+            self._generation_source = GLib.idle_add(self._generate_next_preview,
+                                                    priority=GLib.PRIORITY_LOW)
+    
+    def _generate_next_preview(self):
+        """Render one queued preview per main loop pass so input and drawing get in between"""
+        theme_name, child = self._pending_generation.popitem(last=False)
+        if child.get_parent() is not None:
+            try:
+                # Show what was just rendered rather than reading it back from disk
+                child.image_widget.set_from_pixbuf(self._generate_theme_preview(theme_name))
+            except Exception as e:
+                print(f"Error generating preview for theme '{theme_name}': {e}")
+                child.image_widget.set_from_icon_name('image-missing', Gtk.IconSize.DIALOG)
+            self._remember_preview(child)
+        if self._pending_generation:
+            return True
+        self._generation_source = None
+        return False
+    
+    def _remember_preview(self, child):
+        """Record that child shows a preview, evicting the oldest beyond PREVIEW_CACHE_SIZE"""
+        lru = self._preview_lru
+        lru[child.theme_name] = child
+        lru.move_to_end(child.theme_name)
+        while len(lru) > self.PREVIEW_CACHE_SIZE:
+            self._unload_theme_item_preview(next(iter(lru.values())))
+    
+    def _unload_theme_item_preview(self, child):
+        """Put the placeholder back on a theme item so its pixbuf can be freed"""
+        if child.theme_name == self.parent_clock.theme.name and self.in_memory_preview_pixbuf is not None:
+            # Unsaved edits only exist in memory; reloading from disk would lose them
+            self._preview_lru.move_to_end(child.theme_name)
+            return
+        self._preview_lru.pop(child.theme_name, None)
+        child.image_widget.set_from_icon_name('image-x-generic', Gtk.IconSize.DIALOG)
+    
+    def _cached_preview_pixbuf(self, preview_path, mtime_ns):
+        """Return the decoded preview if it is cached for this mtime_ns, else None"""
+        cache = CustomizeDialog._preview_cache
+        cached = cache.get(preview_path)
+        if cached is not None and cached[0] == mtime_ns:
+            cache.move_to_end(preview_path)
+            return cached[1]
+        return None
+    
+    def _store_preview_pixbuf(self, preview_path, mtime_ns, pixbuf):
+        """Add a decoded preview to the shared cache, dropping the oldest beyond PREVIEW_CACHE_SIZE"""
+        cache = CustomizeDialog._preview_cache
+        cache[preview_path] = (mtime_ns, pixbuf)
+        cache.move_to_end(preview_path)
+        while len(cache) > self.PREVIEW_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _get_theme_preview_path(self, theme_name):
+        """Get the path to a theme's preview image"""
+        if theme_name == 'default':
+            # Store default preview in config dir
+            return os.path.join(self.parent_clock.config_dir, 'default_preview.png')
+        return os.path.join(self.parent_clock.themes_dir, f"{theme_name}.png")
+    
+    def _ensure_preview_dir(self):
+        """Create the preview directories on the first write from this dialog"""
+        if not self._preview_dir_created:
+            # themes_dir sits inside config_dir, so this covers the default preview too
+            os.makedirs(self.parent_clock.themes_dir, exist_ok=True)
+            self._preview_dir_created = True
+    
+    def _blank_preview_context(self):
+        """Cairo context on the shared preview surface, cleared to transparent"""
+        cr = cairo.Context(self._preview_surface)
+        cr.set_operator(cairo.OPERATOR_CLEAR)
+        cr.paint()
+        cr.set_operator(cairo.OPERATOR_OVER)
+        return cr
+    
+    def _generate_theme_preview(self, theme_name):
+        """Generate a PREVIEW_SIZE square preview image for a theme, save it to disk and return it as a pixbuf"""
+        # Load the theme on the side; the clock's own theme is never touched
         temp_theme = Theme(theme_name, self.parent_clock.themes_dir)
         temp_theme.load()
-        self.parent_clock.theme = temp_theme
-        
-        # Create a 200x200 surface
-        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 200, 200)
-        cr = cairo.Context(surface)
         
-        # Clear background
-        cr.set_source_rgba(0, 0, 0, 0)
-        cr.paint()
+        size = self.PREVIEW_SIZE
+        surface = self._preview_surface
+        cr = self._blank_preview_context()
         
         # Draw clock using the same rendering method as main clock
-        # Center at 100,100 with radius 80
+        # Centered, with radius 80% of half the size
         # Use settings for second hand visibility
-        show_seconds = self.parent_clock.settings.get('show_second_hand')
-        self.parent_clock._draw_clock_face(cr, 100, 100, 80, show_date=False, show_seconds=show_seconds)
-        
-        # Restore original theme
-        self.parent_clock.theme = saved_theme
-        self.parent_clock.queue_draw()
+        show_seconds = self._cached_show_seconds
+        self.parent_clock._draw_clock_face(cr, size // 2, size // 2, size * 2 // 5, show_date=False, show_seconds=show_seconds,
+                                           theme=temp_theme)
         
         # Save to file
         preview_path = self._get_theme_preview_path(theme_name)
-        os.makedirs(os.path.dirname(preview_path), exist_ok=True)
+        self._ensure_preview_dir()
         surface.write_to_png(preview_path)
+        self._theme_dir_snapshot[theme_name] = os.stat(preview_path).st_mtime_ns
+        return Gdk.pixbuf_get_from_surface(surface, 0, 0, size, size)
     
     def _generate_preview_surface_from_current_state(self):
         """Generate a preview surface from current theme state without saving to disk"""
-        import cairo
-        
-        # Create a 200x200 surface
-        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 200, 200)
-        cr = cairo.Context(surface)
-        
-        # Clear background
-        cr.set_source_rgba(0, 0, 0, 0)
-        cr.paint()
+        size = self.PREVIEW_SIZE
+        surface = self._preview_surface
+        cr = self._blank_preview_context()
         
         # Draw clock using the same rendering method as main clock
-        # Center at 100,100 with radius 80
+        # Centered, with radius 80% of half the size
         # Use settings for second hand visibility
-        show_seconds = self.parent_clock.settings.get('show_second_hand')
-        self.parent_clock._draw_clock_face(cr, 100, 100, 80, show_date=False, show_seconds=show_seconds)
+        show_seconds = self._cached_show_seconds
+        self.parent_clock._draw_clock_face(cr, size // 2, size // 2, size * 2 // 5, show_date=False, show_seconds=show_seconds)
         
         return surface
     
     def _regenerate_current_theme_preview(self):
         """Regenerate preview for current theme from in-memory state and store in memory"""
+        # Nobody can see the grid: render once it is shown again (or the preview is saved)
+        if not self.get_mapped() or not self.themes_flow.get_mapped():
+            self._preview_pending = True
+            return
+        self._preview_pending = False
+        
         # Generate preview surface from current state
         surface = self._generate_preview_surface_from_current_state()
         
-        # Convert surface to pixbuf for display
-        import io
-        buffer = io.BytesIO()
-        surface.write_to_png(buffer)
-        buffer.seek(0)
-        
-        from gi.repository import GdkPixbuf
-        loader = GdkPixbuf.PixbufLoader.new_with_type('png')
-        loader.write(buffer.read())
-        loader.close()
-        pixbuf = loader.get_pixbuf()
+        # Convert surface to pixbuf for display, straight from its pixel buffer
+        size = self.PREVIEW_SIZE
+        pixbuf = Gdk.pixbuf_get_from_surface(surface, 0, 0, size, size)
         
         # Store in memory (only one theme can be dirty at a time)
         self.in_memory_preview_pixbuf = pixbuf
@@ -1680,26 +1658,34 @@ class CustomizeDialog(Gtk.Dialog):
         # Update the theme item display
         self._update_theme_item_preview(self.parent_clock.theme.name, pixbuf)
     
+    def _on_map_render_pending_preview(self, widget):
+        if self._preview_pending:
+            self._regenerate_current_theme_preview()
+    
     def _update_theme_item_preview(self, theme_name, pixbuf):
         """Update the preview image for a specific theme item in the grid"""
-        # Find the theme item in the flowbox
-        for child in self.themes_flow.get_children():
-            if hasattr(child, 'theme_name') and child.theme_name == theme_name:
-                # Get the box inside the child
-                box = child.get_child()
-                if box:
-                    # Get the image widget (first child of the box)
-                    children = box.get_children()
-                    if children and isinstance(children[0], Gtk.Image):
-                        children[0].set_from_pixbuf(pixbuf)
-                break
+        # A decode of the file on disk still in flight must not overwrite this
+        self._decoding.pop(theme_name, None)
+        child = self._theme_children.get(theme_name)
+        if child is not None:
+            child.image_widget.set_from_pixbuf(pixbuf)
+            # The lazy loader must not replace it from disk
+            self._remember_preview(child)
     
     def _save_in_memory_preview_to_disk(self):
         """Save the in-memory preview to disk for the current theme"""
+        if self._preview_pending:
+            # The latest edits were never rendered; do it now, off screen
+            self._preview_pending = False
+            size = self.PREVIEW_SIZE
+            surface = self._generate_preview_surface_from_current_state()
+            self.in_memory_preview_pixbuf = Gdk.pixbuf_get_from_surface(surface, 0, 0, size, size)
         if self.in_memory_preview_pixbuf:
             preview_path = self._get_theme_preview_path(self.parent_clock.theme.name)
-            os.makedirs(os.path.dirname(preview_path), exist_ok=True)
+            self._ensure_preview_dir()
             self.in_memory_preview_pixbuf.savev(preview_path, 'png', [], [])
+            self._theme_dir_snapshot[self.parent_clock.theme.name] = os.stat(preview_path).st_mtime_ns
+            CustomizeDialog._preview_cache.pop(preview_path, None)
             # Clear in-memory preview after saving
             self.in_memory_preview_pixbuf = None
     
@@ -1757,8 +1743,9 @@ class CustomizeDialog(Gtk.Dialog):
     
     def _apply_theme(self, theme_name):
         """Apply a theme using atomic reference swap"""
+        previous_name = self.parent_clock.theme.name
+        
         # Create new theme object
-        from theme import Theme
         new_theme = Theme(theme_name, self.parent_clock.themes_dir)
         new_theme.load()
         
@@ -1767,6 +1754,10 @@ class CustomizeDialog(Gtk.Dialog):
         
         # Update dialog controls to reflect new theme
         self._update_controls_from_clock()
+        if self._preview_source is not None:
+            # Armed by the control refresh above, not by an edit
+            GLib.source_remove(self._preview_source)
+            self._preview_source = None
         
         # Clear dirty flag since we just loaded a clean theme
         self.save_button.set_sensitive(False)
@@ -1778,14 +1769,24 @@ class CustomizeDialog(Gtk.Dialog):
         self._populate_themes()
         
         # Clear any in-memory preview since we're now on a clean theme
+        dropped_preview = self.in_memory_preview_pixbuf is not None
         self.in_memory_preview_pixbuf = None
+        self._preview_pending = False
+        if dropped_preview:
+            # The previously active item still shows the discarded edits. Reload it from
+            # disk; _populate_themes only does so when the active name changed, not
+            # when the same theme was re-applied to discard its changes.
+            child = self._theme_children.get(previous_name)
+            if child is not None and previous_name in self._preview_lru:
+                self._unload_theme_item_preview(child)
+                self._queue_visible_previews()
         
         # Save settings with new active theme
         self.parent_clock.settings.set('active_theme_name', theme_name)
         self.parent_clock.settings.save()
         
         # Redraw clock to show new theme
-        self.parent_clock.queue_draw()
+        self._queue_clock_redraw()
     
     def on_delete_theme_clicked(self, button):
         """Handle delete theme button click"""
@@ -1851,8 +1852,7 @@ class CustomizeDialog(Gtk.Dialog):
         content.set_margin_top(12)
         content.set_margin_bottom(12)
         
-        label = Gtk.Label(label="Theme name:")
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel("Theme name:")
         content.pack_start(label, False, False, 0)
         
         entry = Gtk.Entry()
@@ -1889,7 +1889,6 @@ class CustomizeDialog(Gtk.Dialog):
             self._save_in_memory_preview_to_disk()
             
             # Switch to the new theme by creating new Theme object
-            from theme import Theme
             self.parent_clock.theme = Theme(theme_name, self.parent_clock.themes_dir)
             self.parent_clock.theme.load()
             
@@ -1906,44 +1905,36 @@ class CustomizeDialog(Gtk.Dialog):
             
             # Settings already saved above
     
-    def _add_slider(self, grid, row, label_text, value, min_val, max_val, callback, discrete=False, step=None, logarithmic=False):
+    def _mklabel(self, text, visible=True, markup=False, dim=False):
+        """Helper to create a start-aligned label with all properties set at construction"""
+        label = Gtk.Label(label=text, halign=Gtk.Align.START, visible=visible, use_markup=markup)
+        if dim:
+            label.get_style_context().add_class('dim-label')
+        return label
+    
+    def _add_slider(self, grid, row, label_text, value, min_val, max_val, callback, discrete=False, step=None, logarithmic=False, digits=None):
         """Helper to add a labeled slider. Returns (label, scale) tuple for tracking."""
-        label = Gtk.Label(label=label_text)
-        label.set_halign(Gtk.Align.START)
+        label = self._mklabel(label_text)
         grid.attach(label, 0, row, 1, 1)
         
         if logarithmic:
             # For logarithmic scale: map value range to log space
             # min_val to max_val -> log(min_val) to log(max_val)
-            import math
-            log_min = math.log(min_val)
-            log_max = math.log(max_val)
-            log_value = math.log(value)
+            log_min = _log(min_val)
+            log_max = _log(max_val)
+            log_value = _log(value)
             
             scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, log_min, log_max, (log_max - log_min) / 100)
+            scale.freeze_notify()
             scale.set_value(log_value)
             scale.set_digits(2)
             
-            # Store original callback and wrap it to convert from log space
-            def log_callback(widget):
-                log_val = widget.get_value()
-                actual_val = math.exp(log_val)
-                # Temporarily disconnect to avoid recursion
-                widget.handler_block_by_func(log_callback)
-                # Update display value
-                widget.set_value(log_val)
-                widget.handler_unblock_by_func(log_callback)
-                # Create a fake widget with the actual value for the callback
-                class FakeWidget:
-                    def get_value(self):
-                        return actual_val
-                callback(FakeWidget())
-            
-            scale.connect("value-changed", log_callback)
+            # Callback sees the value converted back from log space
+            self._connect_scale(scale, callback, _LogScaleValue(scale))
             
             # Custom format function to display actual value
             def format_value(scale, log_val):
-                actual_val = math.exp(log_val)
+                actual_val = _exp(log_val)
                 return f"{actual_val:.2f}"
             scale.connect("format-value", format_value)
             
@@ -1951,40 +1942,91 @@ class CustomizeDialog(Gtk.Dialog):
             # Calculate step based on range and discrete mode
             if step:
                 actual_step = step
-                digits = 0
+                default_digits = 0
             elif discrete:
                 actual_step = 1
-                digits = 0
+                default_digits = 0
             else:
                 range_size = max_val - min_val
                 actual_step = range_size / 100 if range_size < 10 else 1
-                digits = 3 if range_size < 10 else 0
+                default_digits = 3 if range_size < 10 else 0
             
             scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, min_val, max_val, actual_step)
+            scale.freeze_notify()
             scale.set_value(value)
-            scale.set_digits(digits)
+            scale.set_digits(default_digits if digits is None else digits)
             
             if discrete:
                 scale.set_round_digits(0)
             
-            scale.connect("value-changed", callback)
+            self._connect_scale(scale, callback)
         
-        scale.set_hexpand(True)
-        scale.set_size_request(400, -1)  # Set minimum width for sliders
-        scale.set_value_pos(Gtk.PositionType.RIGHT)
+        # Set minimum width for sliders. "value" lives on the adjustment, not the widget.
+        scale.set_properties(hexpand=True, width_request=400, value_pos=Gtk.PositionType.RIGHT)
+        scale.thaw_notify()
         
         grid.attach(scale, 1, row, 1, 1)
         
         return (label, scale)
     
-    def _add_color_button(self, grid, row, label_text, color_tuple, callback):
-        """Helper to add a labeled color button with hex value display and copy button"""
-        label = Gtk.Label(label=label_text)
-        label.set_halign(Gtk.Align.START)
+    def _add_width_slider(self, grid, row, hand_type, callback):
+        """Add a hand width slider whose range and mapping follow the hand mode.
+        
+        Starts out empty; _reconfigure_width_slider loads the range and value
+        once the mode is known. Returns (label, scale) tuple for tracking.
+        """
+        label = self._mklabel("Width:")
+        grid.attach(label, 0, row, 1, 1)
+        
+        scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, hexpand=True,
+                          width_request=400, value_pos=Gtk.PositionType.RIGHT)
+        handler_id = self._connect_scale(scale, callback)
+        
+        # Display the actual width rather than its logarithm in image mode
+        def format_value(scale, val):
+            if self._width_modes.get(hand_type) == 'image':
+                return f"{_exp(val):.2f}"
+            return f"{val:.{scale.get_digits()}f}"
+        scale.connect("format-value", format_value)
+        
+        grid.attach(scale, 1, row, 1, 1)
+        self._width_sliders[hand_type] = (scale, handler_id)
+        
+        return (label, scale)
+    
+    def _connect_scale(self, scale, callback, source=None):
+        """Connect value-changed so callback(source or scale) runs at most once per frame (16ms) while dragging.
+        
+        Returns the handler id.
+        """
+        if source is None:
+            source = scale
+        return scale.connect("value-changed", lambda widget: self._debounce(callback, source, id(widget)))
+    
+    def _debounce(self, callback, widget, key, delay_ms=16):
+        """Collapse a burst of callback(widget) calls under key into one call after delay_ms.
+        
+        An already pending call is left armed rather than restarted, so a
+        continuous drag still updates once per frame; the callback reads the
+        widget's current value when it finally runs.
+        """
+        if key in self._pending_updates:
+            return
+        def fire():
+            del self._pending_updates[key]
+            callback(widget)
+            return False
+        self._pending_updates[key] = (GLib.timeout_add(delay_ms, fire), callback, widget)
+    
+    def _add_color_button(self, grid, row, label_text, color_tuple, callback, visible=True):
+        """Helper to add a labeled color button with hex value display and copy button.
+        Returns (label, hbox, color_button, hex_label, copy_button) tuple for tracking."""
+        label = self._mklabel(label_text, visible=visible)
         grid.attach(label, 0, row, 1, 1)
         
         # Create horizontal box for button, hex label, and copy button
         hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        hbox.set_visible(visible)
         
         color_button = Gtk.ColorButton()
         color_button.set_use_alpha(False)  # Disable alpha channel for clearer color selection
@@ -1995,64 +2037,54 @@ class CustomizeDialog(Gtk.Dialog):
         
         # Add hex value label
         hex_label = Gtk.Label()
-        hex_label.set_text(self._color_to_hex(color_tuple))
+        hex_label.set_text(_color_to_hex(color_tuple))
         hex_label.set_selectable(True)  # Allow copying
         hex_label.set_halign(Gtk.Align.START)
         hex_label.get_style_context().add_class("monospace")
         hbox.pack_start(hex_label, False, False, 0)
         
         # Add copy button
-        copy_button = Gtk.Button()
-        copy_button.set_label("📋")
-        copy_button.set_tooltip_text("Copy to clipboard")
-        copy_button.set_relief(Gtk.ReliefStyle.NONE)
-        
-        def copy_to_clipboard(btn):
-            clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-            clipboard.set_text(hex_label.get_text(), -1)
-        
-        copy_button.connect("clicked", copy_to_clipboard)
+        copy_button = Gtk.Button(label="📋", tooltip_text="Copy to clipboard", relief=Gtk.ReliefStyle.NONE)
+        copy_button.hex_label = hex_label
+        copy_button.connect("clicked", self._on_copy_hex_clicked)
         hbox.pack_start(copy_button, False, False, 0)
         
         # Store hex label reference for updates
         color_button.hex_label = hex_label
         
-        # Wrap callback to update hex label
-        def wrapped_callback(button):
-            rgba = button.get_rgba()
-            color = (rgba.red, rgba.green, rgba.blue)
-            button.hex_label.set_text(self._color_to_hex(color))
-            callback(button)
-        
-        color_button.connect("color-set", wrapped_callback)
+        # Update hex label, then pass the change on
+        color_button.connect("color-set", partial(_color_set, self, hex_label, callback))
         grid.attach(hbox, 1, row, 1, 1)
         
-        return (label, color_button)
+        return (label, hbox, color_button, hex_label, copy_button)
+    
+    def _on_copy_hex_clicked(self, button):
+        """Copy the hex value shown next to a color button to the clipboard"""
+        if self._clipboard is None:
+            self._clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
+        self._clipboard.set_text(button.hex_label.get_text(), -1)
     
     def _tuple_to_rgba(self, color_tuple):
-        """Convert (R, G, B) tuple to Gdk.RGBA"""
-        rgba = Gdk.RGBA()
-        rgba.red = color_tuple[0]
-        rgba.green = color_tuple[1]
-        rgba.blue = color_tuple[2]
-        rgba.alpha = 1.0
+        """Convert (R, G, B) tuple to an opaque Gdk.RGBA.
+        
+        Fills and returns the dialog's shared scratch RGBA, so pass it straight
+        to set_rgba (which copies) rather than keeping it.
+        """
+        rgba = self._rgba_scratch
+        rgba.red, rgba.green, rgba.blue = color_tuple
         return rgba
     
     def _rgba_to_tuple(self, rgba):
         """Convert Gdk.RGBA to (R, G, B) tuple"""
         return (rgba.red, rgba.green, rgba.blue)
     
-    def _color_to_hex(self, color_tuple):
-        """Convert (R, G, B) tuple (0.0-1.0) to hex string #RRGGBB"""
-        r = int(color_tuple[0] * 255)
-        g = int(color_tuple[1] * 255)
-        b = int(color_tuple[2] * 255)
-        return f"#{r:02X}{g:02X}{b:02X}"
-    
     # Callback methods
     def on_size_changed(self, scale):
         size = int(scale.get_value())
-        self._on_settings_property_changed('clock_size', size)
+        # Resize live, but only write the settings file once the drag settles
+        self.parent_clock.settings.set('clock_size', size)
+        self._queue_settings_save()
+        self._queue_clock_redraw()
         self.parent_clock.update_window_size()
     
     def on_background_color_changed(self, button):
@@ -2096,8 +2128,9 @@ class CustomizeDialog(Gtk.Dialog):
     
     def _format_hand_image_label(self, hand_type):
         """Format label for hand image display (hour, minute, or second)"""
-        source = self.parent_clock.theme.get(f'{hand_type}_hand_image_source')
-        name = self.parent_clock.theme.get(f'{hand_type}_hand_image_name')
+        theme = self.parent_clock.theme
+        source = theme.get(f'{hand_type}_hand_image_source')
+        name = theme.get(f'{hand_type}_hand_image_name')
         
         if source == 'none' or not name:
             return '(none)'
@@ -2105,25 +2138,35 @@ class CustomizeDialog(Gtk.Dialog):
         # Display just the hand set name (folder name)
         return name
     
+    def _refresh_hand_labels(self):
+        """Update the hand theme label, and any per-hand image labels, in one pass.
+        
+        Changing a single hand can turn the shared label into '(mixed)', so
+        every hand image edit refreshes all of them together.
+        """
+        self.hand_theme_label.set_text(self._format_hand_theme_label())
+        for hand_type in ('hour', 'minute', 'second'):
+            label = getattr(self, f'{hand_type}_hand_image_label', None)
+            if label is not None:
+                label.set_text(self._format_hand_image_label(hand_type))
+    
     def _format_hand_theme_label(self):
         """Format label for unified hand theme display"""
-        # Check if all hands use the same theme
-        hour_source = self.parent_clock.theme.get('hour_hand_image_source')
-        hour_name = self.parent_clock.theme.get('hour_hand_image_name')
-        minute_source = self.parent_clock.theme.get('minute_hand_image_source')
-        minute_name = self.parent_clock.theme.get('minute_hand_image_name')
-        second_source = self.parent_clock.theme.get('second_hand_image_source')
-        second_name = self.parent_clock.theme.get('second_hand_image_name')
+        theme = self.parent_clock.theme
+        hour_source = theme.get('hour_hand_image_source')
+        minute_source = theme.get('minute_hand_image_source')
+        second_source = theme.get('second_hand_image_source')
         
         # If all are none
         if hour_source == 'none' and minute_source == 'none' and second_source == 'none':
             return '(none)'
         
-        # If all use the same theme
-        if (hour_source == minute_source == second_source and 
-            hour_name == minute_name == second_name and 
-            hour_name is not None):
-            return hour_name
+        # Names only matter once all hands share a source
+        if hour_source == minute_source == second_source:
+            hour_name = theme.get('hour_hand_image_name')
+            if (hour_name is not None and
+                hour_name == theme.get('minute_hand_image_name') == theme.get('second_hand_image_name')):
+                return hour_name
         
         # Mixed themes
         return '(mixed)'
@@ -2138,20 +2181,25 @@ class CustomizeDialog(Gtk.Dialog):
         self._on_theme_property_changed('enable_face_texture', value)
         self._update_texture_controls_visibility()
     
+    def _apply_visibility(self, pairs):
+        """Apply a batch of (widget, visible) decisions in one pass"""
+        for widget, visible in pairs:
+            widget.set_visible(visible)
+    
     def _update_color_controls_visibility(self):
         visible = self.enable_color_check.get_active()
-        for w in self.face_color_controls:
-            w.set_visible(visible)
+        self._apply_visibility([(w, visible) for w in self.face_color_controls])
     
     def _update_texture_controls_visibility(self):
         visible = self.enable_texture_check.get_active()
-        for w in self.face_texture_controls:
-            w.set_visible(visible)
+        self._apply_visibility([(w, visible) for w in self.face_texture_controls])
     
-    def _update_hand_controls_visibility(self):
-        """Update visibility of hand controls based on whether hand images are used"""
-        import math
+    def _update_hand_controls_visibility(self, force=False):
+        """Update visibility of hand controls based on whether hand images are used.
         
+        Only does anything when the mode (image vs geometric) actually changed,
+        unless force is set (a new theme needs its width values loaded).
+        """
         # Check if any hand has an image
         has_hand_images = False
         for hand_type in ['hour', 'minute', 'second']:
@@ -2160,6 +2208,11 @@ class CustomizeDialog(Gtk.Dialog):
                 has_hand_images = True
                 break
         
+        mode = 'image' if has_hand_images else 'geometric'
+        if mode == self._hand_mode and not force:
+            return
+        self._hand_mode = mode
+        
         # When using hand images:
         # - Hide tail sliders (not applicable to images)
         # - Show width sliders (for scaling image width) - use image_width property
@@ -2172,179 +2225,255 @@ class CustomizeDialog(Gtk.Dialog):
         # - Show color controls
         # - Show length sliders
         
-        if has_hand_images:
-            # Hide tail sliders
-            for widget in self.hour_tail_widgets:
-                widget.set_visible(False)
-            for widget in self.minute_tail_widgets:
-                widget.set_visible(False)
-            for widget in self.second_tail_widgets:
-                widget.set_visible(False)
-            
-            # Show color controls (for recoloring hand images)
-            for widget in self.hands_color_widgets:
-                widget.set_visible(True)
-            
-            # Recreate width sliders for image mode (logarithmic, 0.33-3.0)
-            self._recreate_width_slider('hour', 'image')
-            self._recreate_width_slider('minute', 'image')
-            self._recreate_width_slider('second', 'image')
-            
-        else:
-            # Show tail sliders
-            for widget in self.hour_tail_widgets:
-                widget.set_visible(True)
-            for widget in self.minute_tail_widgets:
-                widget.set_visible(True)
-            for widget in self.second_tail_widgets:
-                widget.set_visible(True)
-            
-            # Show color controls
-            for widget in self.hands_color_widgets:
-                widget.set_visible(True)
-            
-            # Recreate width sliders for geometric mode (linear, 0.01-0.08 for hour, etc.)
-            self._recreate_width_slider('hour', 'geometric')
-            self._recreate_width_slider('minute', 'geometric')
-            self._recreate_width_slider('second', 'geometric')
-    
-    def _recreate_width_slider(self, hand_type, mode):
-        """Recreate a width slider with appropriate range for the mode"""
-        import math
-        
-        # Get current widgets and row
-        if hand_type == 'hour':
-            old_widgets = self.hour_width_widgets
-            row = self.hour_width_row
-            callback = self.on_hour_hand_width_changed
-        elif hand_type == 'minute':
-            old_widgets = self.minute_width_widgets
-            row = self.minute_width_row
-            callback = self.on_minute_hand_width_changed
-        else:  # second
-            old_widgets = self.second_width_widgets
-            row = self.second_width_row
-            callback = self.on_second_hand_width_changed
-        
-        # Remove old widgets from grid
-        for widget in old_widgets:
-            self.hands_page_grid.remove(widget)
-        
-        # Create new slider with appropriate range and scale
+        # Tail sliders only apply to geometric hands; color controls are
+        # shown either way (hand images are recolored in memory)
+        tails_visible = not has_hand_images
+        pairs = [(w, tails_visible) for w in self.hour_tail_widgets]
+        pairs += [(w, tails_visible) for w in self.minute_tail_widgets]
+        pairs += [(w, tails_visible) for w in self.second_tail_widgets]
+        pairs += [(w, True) for w in self.hands_color_widgets]
+        self._apply_visibility(pairs)
+        
+        # Reconfigure width sliders for the mode: logarithmic 0.33-3.0 for images,
+        # linear (0.01-0.08 for hour, etc.) for geometric hands
+        for hand_type in ('hour', 'minute', 'second'):
+            self._reconfigure_width_slider(hand_type, mode)
+    
+    def _reconfigure_width_slider(self, hand_type, mode):
+        """Switch a width slider between image and geometric mode by reconfiguring its adjustment"""
+        scale, handler_id = self._width_sliders[hand_type]
+        theme = self.parent_clock.theme
         if mode == 'image':
-            # Image mode: logarithmic scale, 0.33-3.0, default 1.0
-            value = self.parent_clock.theme.get(f'{hand_type}_hand_image_width')
-            new_widgets = self._add_slider(self.hands_page_grid, row, "Width:", value, 0.33, 3.0,
-                                          callback, logarithmic=True)
+            # Image mode: logarithmic scale, 0.33-3.0
+            lower, upper = (_log(v) for v in _IMAGE_HAND_WIDTH_RANGE)
+            value = _log(theme.get(f'{hand_type}_hand_image_width'))
+            digits = 2
         else:  # geometric
-            # Geometric mode: linear scale with appropriate ranges
-            value = self.parent_clock.theme.get(f'{hand_type}_hand_width')
-            if hand_type == 'hour':
-                new_widgets = self._add_slider(self.hands_page_grid, row, "Width:", value, 0.01, 0.08,
-                                              callback, logarithmic=False)
-            elif hand_type == 'minute':
-                new_widgets = self._add_slider(self.hands_page_grid, row, "Width:", value, 0.005, 0.05,
-                                              callback, logarithmic=False)
-            else:  # second
-                new_widgets = self._add_slider(self.hands_page_grid, row, "Width:", value, 0.002, 0.02,
-                                              callback, logarithmic=False)
-        
-        # Update stored references
-        if hand_type == 'hour':
-            self.hour_width_widgets = new_widgets
-            self.hour_width_scale = new_widgets[1]
-        elif hand_type == 'minute':
-            self.minute_width_widgets = new_widgets
-            self.minute_width_scale = new_widgets[1]
-        else:  # second
-            self.second_width_widgets = new_widgets
-            self.second_width_scale = new_widgets[1]
-        
-        # Show the new widgets
-        for widget in new_widgets:
-            widget.show()
+            # Geometric mode: linear scale with a per-hand range
+            lower, upper = _GEOMETRIC_HAND_WIDTH_RANGES[hand_type]
+            value = theme.get(f'{hand_type}_hand_width')
+            digits = 3
+        self._width_modes[hand_type] = mode
+        
+        step = (upper - lower) / 100
+        scale.set_digits(digits)
+        # Loading the theme's value is not an edit
+        scale.handler_block(handler_id)
+        scale.get_adjustment().configure(value, lower, upper, step, step * 10, 0)
+        scale.handler_unblock(handler_id)
 
 
+    def _watch_picker_thumbnails(self, scrolled, flow):
+        """Decode a picker's thumbnails only for rows in view, after each layout or scroll.
+        
+        Thumbnails missing from the memory cache are decoded on worker threads
+        and set as they arrive, so opening a picker never waits on image files.
+        """
+        vadjustment = scrolled.get_vadjustment()
+        thumbs_dir = self.parent_clock.get_thumbnail_cache_dir()
+        source_id = None
+        in_flight = set()
+        # Edited or re-imported images leave their old thumbnails behind
+        self._get_decode_executor().submit(self._prune_thumbnail_dir, thumbs_dir,
+                                           self.THUMBNAIL_DISK_CACHE_SIZE)
+        
+        def install(img, key, future):
+            if future not in in_flight:
+                # Picker closed meanwhile
+                return False
+            in_flight.discard(future)
+            try:
+                pixbuf = future.result()
+            except Exception:
+                return False
+            self._store_thumbnail(key, pixbuf)
+            img.set_from_pixbuf(pixbuf)
+            return False
+        
+        def request(img, path, width, height):
+            try:
+                key = (path, os.stat(path).st_mtime_ns, width, height)
+            except OSError:
+                return
+            pixbuf = self._cached_thumbnail(key)
+            if pixbuf is not None:
+                img.set_from_pixbuf(pixbuf)
+                return
+            future = self._get_decode_executor().submit(self._decode_thumbnail, thumbs_dir, key)
+            in_flight.add(future)
+            future.add_done_callback(lambda future: GLib.idle_add(install, img, key, future))
+        
+        def load():
+            nonlocal source_id
+            source_id = None
+            top = vadjustment.get_value()
+            bottom = top + vadjustment.get_page_size()
+            for row in flow.get_children():
+                if not row.pending_thumbnails:
+                    continue
+                allocation = row.get_allocation()
+                if allocation.height > 1 and allocation.y + allocation.height >= top and allocation.y <= bottom:
+                    for img, path, width, height in row.pending_thumbnails:
+                        request(img, path, width, height)
+                    row.pending_thumbnails = None
+            return False
+        
+        def queue(*args):
+            nonlocal source_id
+            if source_id is None:
+                source_id = GLib.idle_add(load, priority=GLib.PRIORITY_LOW)
+        
+        def cancel(widget):
+            nonlocal source_id
+            if source_id is not None:
+                GLib.source_remove(source_id)
+                source_id = None
+            # Decodes that haven't started are dropped, running ones are ignored
+            for future in in_flight:
+                future.cancel()
+            in_flight.clear()
+        
+        flow.connect('size-allocate', queue)
+        vadjustment.connect('value-changed', queue)
+        flow.connect('destroy', cancel)
+    
+    def _cached_thumbnail(self, key):
+        """Thumbnail for a (path, mtime_ns, width, height) key from the memory cache, or None"""
+        cache = CustomizeDialog._thumbnail_cache
+        pixbuf = cache.get(key)
+        if pixbuf is not None:
+            cache.move_to_end(key)
+        return pixbuf
+    
+    def _store_thumbnail(self, key, pixbuf):
+        cache = CustomizeDialog._thumbnail_cache
+        cache[key] = pixbuf
+        while len(cache) > self.THUMBNAIL_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    @staticmethod
+    def _decode_thumbnail(thumbs_dir, key):
+        """Image scaled to fit width x height from the on-disk thumbnail cache, or a fresh
+        decode (which is then written to the disk cache). Runs on a worker thread."""
+        path, mtime_ns, width, height = key
+        digest = hashlib.sha1(f"{path}|{mtime_ns}|{width}x{height}".encode()).hexdigest()
+        thumb_path = os.path.join(thumbs_dir, digest + '.png')
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(thumb_path)
+        except GLib.Error:
+            pass
+        else:
+            # Mark it recently used for _prune_thumbnail_dir
+            try:
+                os.utime(thumb_path)
+            except OSError:
+                pass
+            return pixbuf
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, width, height, True)
+        # Write under a temporary name and rename it into place, so a crash or a
+        # concurrent decode of the same image never leaves a truncated thumbnail
+        tmp_path = None
+        try:
+            os.makedirs(thumbs_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=thumbs_dir)
+            os.close(fd)
+            pixbuf.savev(tmp_path, 'png', [], [])
+            os.replace(tmp_path, thumb_path)
+        except (OSError, GLib.Error) as e:
+            print(f"Could not cache thumbnail for {path}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        return pixbuf
+    
+    @staticmethod
+    def _prune_thumbnail_dir(thumbs_dir, keep):
+        """Delete all but the keep most recently used files in the thumbnail cache.
+        Runs on a worker thread."""
+        try:
+            with os.scandir(thumbs_dir) as it:
+                entries = [(entry.stat().st_mtime_ns, entry.path) for entry in it if entry.is_file()]
+        except OSError:
+            return
+        if len(entries) <= keep:
+            return
+        entries.sort(reverse=True)
+        for _, path in entries[keep:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _list_dir_cached(self, directory, want):
+        """Sorted names of entries in directory passing want(DirEntry), reusing the
+        last listing while the directory's mtime is unchanged"""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+        cached = CustomizeDialog._dir_index.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            with os.scandir(directory) as it:
+                names = sorted(entry.name for entry in it if want(entry))
+        except OSError:
+            return []
+        CustomizeDialog._dir_index[directory] = (mtime_ns, names)
+        return names
+    
+    @staticmethod
+    def _is_texture_entry(entry):
+        # Only the extension is lowercased, not the whole name
+        name = entry.name
+        return name[name.rfind('.'):].lower() in _TEXTURE_EXTENSIONS and entry.is_file()
+
     def _iter_texture_files(self):
         textures = []
 
         builtin_dir = self.parent_clock.get_builtin_textures_dir()
-        if os.path.isdir(builtin_dir):
-            for name in sorted(os.listdir(builtin_dir)):
-                if name.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    textures.append(('builtin', name, os.path.join(builtin_dir, name)))
+        for name in self._list_dir_cached(builtin_dir, self._is_texture_entry):
+            textures.append(('builtin', name, os.path.join(builtin_dir, name)))
 
         user_dir = self.parent_clock.get_user_textures_dir()
-        if os.path.isdir(user_dir):
-            for name in sorted(os.listdir(user_dir)):
-                if name.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    textures.append(('user', name, os.path.join(user_dir, name)))
+        for name in self._list_dir_cached(user_dir, self._is_texture_entry):
+            textures.append(('user', name, os.path.join(user_dir, name)))
 
         return textures
 
-    def _open_texture_picker(self, title):
+    def _build_picker_dialog(self, title, columns, import_label, on_import):
+        """Shared picker shell: a FlowBox of thumbnails in a scrolled window with an
+        import button underneath. Returns (dialog, flow); the caller fills flow."""
         dialog = Gtk.Dialog(title=title, parent=self, flags=0)
         dialog.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OK, Gtk.ResponseType.OK)
         dialog.set_default_size(700, 500)
 
         content = dialog.get_content_area()
         
-        # Add CSS for subtle selection color
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            flowboxchild:selected {
-                background-color: rgba(100, 100, 100, 0.2);
-            }
-        """)
-        screen = dialog.get_screen()
-        style_context = dialog.get_style_context()
-        style_context.add_provider_for_screen(screen, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        # Add CSS for subtle selection color (once per screen, not per picker)
+        if CustomizeDialog._picker_css_provider is None:
+            CustomizeDialog._picker_css_provider = Gtk.CssProvider()
+            CustomizeDialog._picker_css_provider.load_from_data(PICKER_CSS)
+            Gtk.StyleContext.add_provider_for_screen(dialog.get_screen(), CustomizeDialog._picker_css_provider,
+                                                     Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
         
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         content.pack_start(scrolled, True, True, 0)
         
         flow = Gtk.FlowBox()
-        flow.set_max_children_per_line(6)
+        flow.set_max_children_per_line(columns)
         flow.set_selection_mode(Gtk.SelectionMode.SINGLE)
         flow.set_row_spacing(10)
         flow.set_column_spacing(10)
         flow.set_activate_on_single_click(False)  # Only activate on double-click
         scrolled.add(flow)
+        self._watch_picker_thumbnails(scrolled, flow)
         
         # Add double-click handler (child-activated only fires on double-click when activate_on_single_click is False)
         flow.connect('child-activated', lambda f, child: dialog.response(Gtk.ResponseType.OK))
-
-        textures = self._iter_texture_files()
-        for source, name, path in textures:
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            box.set_margin_top(6)
-            box.set_margin_bottom(6)
-            box.set_margin_start(6)
-            box.set_margin_end(6)
-
-            img = Gtk.Image()
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, 96, 96, True)
-                img.set_from_pixbuf(pixbuf)
-            except Exception:
-                pass
-
-            # Remove file extension from display name
-            display_name = os.path.splitext(name)[0]
-            label = Gtk.Label(label=display_name)
-            label.set_max_width_chars(18)
-            label.set_ellipsize(Pango.EllipsizeMode.END)
-            label.set_halign(Gtk.Align.CENTER)
-
-            box.pack_start(img, False, False, 0)
-            box.pack_start(label, False, False, 0)
-
-            row = Gtk.FlowBoxChild()
-            row.add(box)
-            row.texture_source = source
-            row.texture_name = name
-            flow.add(row)
         
         # Add Import button at the bottom
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -2353,10 +2482,51 @@ class CustomizeDialog(Gtk.Dialog):
         button_box.set_margin_top(6)
         button_box.set_margin_bottom(12)
         
-        import_button = Gtk.Button(label="Import Texture…")
-        import_button.connect('clicked', lambda btn: self._on_import_texture_from_picker(dialog, flow))
+        import_button = Gtk.Button(label=import_label)
+        import_button.connect('clicked', lambda btn: on_import(dialog, flow))
         button_box.pack_start(import_button, False, False, 0)
         content.pack_start(button_box, False, False, 0)
+        
+        return dialog, flow
+
+    def _build_picker_item(self, preview, label_text):
+        """Picker FlowBoxChild with preview above an ellipsized label"""
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        box.set_margin_top(6)
+        box.set_margin_bottom(6)
+        box.set_margin_start(6)
+        box.set_margin_end(6)
+
+        label = Gtk.Label(label=label_text)
+        label.set_max_width_chars(18)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        label.set_halign(Gtk.Align.CENTER)
+
+        box.pack_start(preview, False, False, 0)
+        box.pack_start(label, False, False, 0)
+
+        row = Gtk.FlowBoxChild()
+        row.add(box)
+        return row
+
+    def _build_texture_child(self, source, name, path):
+        """Texture picker item; the thumbnail is decoded once it scrolls into view
+        (see _watch_picker_thumbnails)"""
+        img = Gtk.Image()
+        img.set_size_request(96, 96)
+
+        # Remove file extension from display name
+        row = self._build_picker_item(img, os.path.splitext(name)[0])
+        row.texture_source = source
+        row.texture_name = name
+        row.texture_path = path
+        row.pending_thumbnails = [(img, path, 96, 96)]
+        return row
+
+    def _open_texture_picker(self, title):
+        dialog, flow = self._build_picker_dialog(title, 6, "Import Texture…", self._on_import_texture_from_picker)
+        for texture in self._iter_texture_files():
+            flow.add(self._build_texture_child(*texture))
 
         dialog.show_all()
         response = dialog.run()
@@ -2366,6 +2536,10 @@ class CustomizeDialog(Gtk.Dialog):
             if sel:
                 child = sel[0]
                 selected = (child.texture_source, child.texture_name)
+                # Start the full-size decode now, ahead of the redraw that applies it
+                self.parent_clock.preload_texture(child.texture_path, self._get_decode_executor())
+        if selected is None:
+            self.parent_clock.cancel_texture_preload()
         dialog.destroy()
         return selected
 
@@ -2377,17 +2551,20 @@ class CustomizeDialog(Gtk.Dialog):
         self.parent_clock.theme.set('face_texture_source', source)
         self.parent_clock.theme.set('face_texture_name', name)
         self.face_texture_label.set_text(self._format_texture_label(name))
-        self._mark_dirty()
-        self._regenerate_current_theme_preview()
-        self.parent_clock.queue_draw()
+        self._invalidate_theme()
 
 
     def _on_import_texture_from_picker(self, picker_dialog, flow):
-        """Import texture from within the texture picker dialog and refresh the list"""
+        """Import texture from within the texture picker dialog and add it to the list"""
         imported_name = self._import_texture_file(picker_dialog)
         if imported_name:
-            # Refresh the texture list in the picker
-            self._refresh_texture_flow(flow)
+            # Insert just the new item at its sorted place instead of rebuilding the list
+            for position, texture in enumerate(self._iter_texture_files()):
+                if texture[0] == 'user' and texture[1] == imported_name:
+                    child = self._build_texture_child(*texture)
+                    flow.insert(child, position)
+                    child.show_all()
+                    break
     
     def _import_texture_file(self, parent_dialog):
         """Import a texture file and return the imported filename, or None if cancelled/failed"""
@@ -2414,19 +2591,22 @@ class CustomizeDialog(Gtk.Dialog):
         dest_dir = self.parent_clock.get_user_textures_dir()
         os.makedirs(dest_dir, exist_ok=True)
 
+        # One listing instead of an exists() probe per candidate name
+        existing = set(os.listdir(dest_dir))
         base = os.path.basename(path)
         name, ext = os.path.splitext(base)
-        dest = os.path.join(dest_dir, base)
         i = 1
-        while os.path.exists(dest):
-            dest = os.path.join(dest_dir, f"{name}_{i}{ext}")
+        while base in existing:
             base = f"{name}_{i}{ext}"
             i += 1
+        dest = os.path.join(dest_dir, base)
 
         try:
             shutil.copy2(path, dest)
         except Exception:
             return None
+        # Don't rely on the directory mtime having ticked between two quick imports
+        CustomizeDialog._dir_index.pop(dest_dir, None)
 
         # Invalidate cached surface if any
         if hasattr(self.parent_clock, '_texture_surface_cache'):
@@ -2434,46 +2614,6 @@ class CustomizeDialog(Gtk.Dialog):
         
         return base
     
-    def _refresh_texture_flow(self, flow):
-        """Refresh the texture list in a FlowBox"""
-        # Remove all existing children
-        for child in flow.get_children():
-            flow.remove(child)
-        
-        # Re-populate with updated texture list
-        textures = self._iter_texture_files()
-        for source, name, path in textures:
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            box.set_margin_top(6)
-            box.set_margin_bottom(6)
-            box.set_margin_start(6)
-            box.set_margin_end(6)
-
-            img = Gtk.Image()
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, 96, 96, True)
-                img.set_from_pixbuf(pixbuf)
-            except Exception:
-                pass
-
-            # Remove file extension from display name
-            display_name = os.path.splitext(name)[0]
-            label = Gtk.Label(label=display_name)
-            label.set_max_width_chars(18)
-            label.set_ellipsize(Pango.EllipsizeMode.END)
-            label.set_halign(Gtk.Align.CENTER)
-
-            box.pack_start(img, False, False, 0)
-            box.pack_start(label, False, False, 0)
-
-            row = Gtk.FlowBoxChild()
-            row.add(box)
-            row.texture_source = source
-            row.texture_name = name
-            flow.add(row)
-        
-        flow.show_all()
-    
     def on_import_texture_clicked(self, button):
         """Legacy method - no longer used since import is now in texture picker"""
         pass
@@ -2486,138 +2626,91 @@ class CustomizeDialog(Gtk.Dialog):
         """
         # Builtin hands
         builtin_dir = os.path.join(os.path.dirname(__file__), 'assets', 'hands')
-        if os.path.exists(builtin_dir):
-            for entry in os.listdir(builtin_dir):
-                hand_dir = os.path.join(builtin_dir, entry)
-                if os.path.isdir(hand_dir):
-                    paths = self._get_hand_set_paths(hand_dir)
-                    if paths:
-                        yield ('builtin', entry, paths)
+        for entry in self._list_dir_cached(builtin_dir, os.DirEntry.is_dir):
+            paths = self._get_hand_set_paths(os.path.join(builtin_dir, entry))
+            if paths:
+                yield ('builtin', entry, paths)
         
         # User hands
         user_dir = self.parent_clock.get_user_hands_dir()
-        if os.path.exists(user_dir):
-            for entry in os.listdir(user_dir):
-                hand_dir = os.path.join(user_dir, entry)
-                if os.path.isdir(hand_dir):
-                    paths = self._get_hand_set_paths(hand_dir)
-                    if paths:
-                        yield ('user', entry, paths)
+        for entry in self._list_dir_cached(user_dir, os.DirEntry.is_dir):
+            paths = self._get_hand_set_paths(os.path.join(user_dir, entry))
+            if paths:
+                yield ('user', entry, paths)
     
     def _get_hand_set_paths(self, hand_dir):
         """
         Get paths to hand images in a hand set directory.
         Prefers processed images, falls back to original.
         Returns dict with 'hour', 'minute', 'second' keys, or None if incomplete.
+        The result is reused while hand_dir and its subfolders are unchanged.
         """
+        stamp = []
+        for folder in (hand_dir, os.path.join(hand_dir, 'processed'), os.path.join(hand_dir, 'original')):
+            try:
+                stamp.append(os.stat(folder).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        stamp = tuple(stamp)
+        cached = CustomizeDialog._hand_set_paths_cache.get(hand_dir)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        paths = self._find_hand_set_paths(hand_dir)
+        CustomizeDialog._hand_set_paths_cache[hand_dir] = (stamp, paths)
+        return paths
+    
+    def _find_hand_set_paths(self, hand_dir):
+        """Probe hand_dir for the three hand images (uncached _get_hand_set_paths).
+        
+        Each folder is listed at most once, rather than checking every
+        candidate file separately.
+        """
+        # Processed images first, then originals, then the legacy flat layout
+        folders = [os.path.join(hand_dir, 'processed'), os.path.join(hand_dir, 'original'), hand_dir]
+        listings = {}
         paths = {}
         
         for hand_type in ['hour', 'minute', 'second']:
-            # Try processed image first
-            processed_path = os.path.join(hand_dir, 'processed', f'{hand_type}.png')
-            if os.path.exists(processed_path):
-                paths[hand_type] = processed_path
-                continue
-            
-            # Fall back to original image
-            original_path = os.path.join(hand_dir, 'original', f'{hand_type}.png')
-            if os.path.exists(original_path):
-                paths[hand_type] = original_path
-                continue
-            
-            # Legacy: try direct path
-            legacy_path = os.path.join(hand_dir, f'{hand_type}.png')
-            if os.path.exists(legacy_path):
-                paths[hand_type] = legacy_path
-                continue
-            
-            # Hand image not found
-            return None
+            filename = f'{hand_type}.png'
+            for folder in folders:
+                names = listings.get(folder)
+                if names is None:
+                    try:
+                        names = listings[folder] = set(os.listdir(folder))
+                    except OSError:
+                        names = listings[folder] = set()
+                if filename in names:
+                    paths[hand_type] = os.path.join(folder, filename)
+                    break
+            else:
+                # Hand image not found
+                return None
         
-        # All three hand images must exist
-        if len(paths) == 3:
-            return paths
-        return None
+        return paths
     
-    def _open_hand_picker(self, title):
-        """Open hand image set picker dialog"""
-        dialog = Gtk.Dialog(title=title, parent=self, flags=0)
-        dialog.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OK, Gtk.ResponseType.OK)
-        dialog.set_default_size(700, 500)
-
-        content = dialog.get_content_area()
-        
-        # Add CSS for subtle selection color
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            flowboxchild:selected {
-                background-color: rgba(100, 100, 100, 0.2);
-            }
-        """)
-        screen = dialog.get_screen()
-        style_context = dialog.get_style_context()
-        style_context.add_provider_for_screen(screen, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+    def _build_hand_child(self, source, name, paths):
+        """Hand set picker item showing all three hands, decoded once it scrolls into
+        view (see _watch_picker_thumbnails)"""
+        preview_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=3)
+        thumbnails = []
         
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        content.pack_start(scrolled, True, True, 0)
-        
-        flow = Gtk.FlowBox()
-        flow.set_max_children_per_line(4)
-        flow.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        flow.set_row_spacing(10)
-        flow.set_column_spacing(10)
-        flow.set_activate_on_single_click(False)
-        scrolled.add(flow)
-        
-        # Add double-click handler
-        flow.connect('child-activated', lambda f, child: dialog.response(Gtk.ResponseType.OK))
-
-        hand_sets = self._iter_hand_sets()
-        for source, name, paths in hand_sets:
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            box.set_margin_top(6)
-            box.set_margin_bottom(6)
-            box.set_margin_start(6)
-            box.set_margin_end(6)
-
-            # Create a composite preview showing all three hands
-            preview_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=3)
-            
-            for hand_type in ['hour', 'minute', 'second']:
-                img = Gtk.Image()
-                try:
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(paths[hand_type], 30, 80, True)
-                    img.set_from_pixbuf(pixbuf)
-                except Exception:
-                    pass
-                preview_box.pack_start(img, False, False, 0)
-
-            label = Gtk.Label(label=name)
-            label.set_max_width_chars(18)
-            label.set_ellipsize(Pango.EllipsizeMode.END)
-            label.set_halign(Gtk.Align.CENTER)
-
-            box.pack_start(preview_box, False, False, 0)
-            box.pack_start(label, False, False, 0)
+        for hand_type in ['hour', 'minute', 'second']:
+            img = Gtk.Image()
+            img.set_size_request(30, 80)
+            thumbnails.append((img, paths[hand_type], 30, 80))
+            preview_box.pack_start(img, False, False, 0)
 
-            row = Gtk.FlowBoxChild()
-            row.add(box)
-            row.hand_source = source
-            row.hand_name = name
-            flow.add(row)
-        
-        # Add Import button at the bottom
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        button_box.set_margin_start(12)
-        button_box.set_margin_end(12)
-        button_box.set_margin_top(6)
-        button_box.set_margin_bottom(12)
-        
-        import_button = Gtk.Button(label="Import Hand Set…")
-        import_button.connect('clicked', lambda btn: self._on_import_hand_set_from_picker(dialog, flow))
-        button_box.pack_start(import_button, False, False, 0)
-        content.pack_start(button_box, False, False, 0)
+        row = self._build_picker_item(preview_box, name)
+        row.hand_source = source
+        row.hand_name = name
+        row.pending_thumbnails = thumbnails
+        return row
+    
+    def _open_hand_picker(self, title):
+        """Open hand image set picker dialog"""
+        dialog, flow = self._build_picker_dialog(title, 4, "Import Hand Set…", self._on_import_hand_set_from_picker)
+        for hand_set in self._iter_hand_sets():
+            flow.add(self._build_hand_child(*hand_set))
 
         dialog.show_all()
         response = dialog.run()
@@ -2631,11 +2724,16 @@ class CustomizeDialog(Gtk.Dialog):
         return selected
     
     def _on_import_hand_set_from_picker(self, picker_dialog, flow):
-        """Import hand set from within the hand picker dialog and refresh the list"""
+        """Import hand set from within the hand picker dialog and add it to the list"""
         imported_name = self._import_hand_set(picker_dialog)
         if imported_name:
-            # Refresh the hand set list in the picker
-            self._refresh_hand_flow(flow)
+            # Insert just the new item at its sorted place instead of rebuilding the list
+            for position, hand_set in enumerate(self._iter_hand_sets()):
+                if hand_set[0] == 'user' and hand_set[1] == imported_name:
+                    child = self._build_hand_child(*hand_set)
+                    flow.insert(child, position)
+                    child.show_all()
+                    break
     
     def _import_hand_set(self, parent_dialog):
         """Import a hand set folder and return the folder name, or None if cancelled/failed"""
@@ -2674,64 +2772,185 @@ class CustomizeDialog(Gtk.Dialog):
         dest_dir = self.parent_clock.get_user_hands_dir()
         os.makedirs(dest_dir, exist_ok=True)
 
+        existing = set(os.listdir(dest_dir))
         folder_name = os.path.basename(path)
-        dest = os.path.join(dest_dir, folder_name)
         i = 1
-        while os.path.exists(dest):
-            dest = os.path.join(dest_dir, f"{folder_name}_{i}")
+        while folder_name in existing:
             folder_name = f"{folder_name}_{i}"
             i += 1
+        dest = os.path.join(dest_dir, folder_name)
 
         try:
-            shutil.copytree(path, dest)
+            # Hand images need their contents only, not each file's mode/times/xattrs
+            shutil.copytree(path, dest, copy_function=shutil.copyfile)
         except Exception:
             return None
+        CustomizeDialog._dir_index.pop(dest_dir, None)
 
         return folder_name
     
-    def _refresh_hand_flow(self, flow):
-        """Refresh the hand set list in a FlowBox"""
-        # Remove all existing children
-        for child in flow.get_children():
-            flow.remove(child)
-        
-        # Re-populate with updated hand set list
-        hand_sets = self._iter_hand_sets()
-        for source, name, paths in hand_sets:
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            box.set_margin_top(6)
-            box.set_margin_bottom(6)
-            box.set_margin_start(6)
-            box.set_margin_end(6)
-
-            # Create a composite preview showing all three hands
-            preview_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=3)
-            
-            for hand_type in ['hour', 'minute', 'second']:
-                img = Gtk.Image()
-                try:
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(paths[hand_type], 30, 80, True)
-                    img.set_from_pixbuf(pixbuf)
-                except Exception:
-                    pass
-                preview_box.pack_start(img, False, False, 0)
-
-            label = Gtk.Label(label=name)
-            label.set_max_width_chars(18)
-            label.set_ellipsize(Pango.EllipsizeMode.END)
-            label.set_halign(Gtk.Align.CENTER)
-
-            box.pack_start(preview_box, False, False, 0)
-            box.pack_start(label, False, False, 0)
-
-            row = Gtk.FlowBoxChild()
-            row.add(box)
-            row.hand_source = source
-            row.hand_name = name
-            flow.add(row)
+    def _build_hour_tick_controls(self, row):
+        """Add the hour tick style, size, shape and color rows to the ticks grid.
+        Returns the widgets added."""
+        theme = self.parent_clock.theme
+        grid = self.ticks_grid
+        hour_tick_style = theme.get('hour_tick_style')
         
-        flow.show_all()
-
+        # Hour tick style dropdown
+        label = self._mklabel("Style:")
+        self.hour_tick_controls.append(label)
+        grid.attach(label, 0, row, 1, 1)
+        
+        self.style_combo = Gtk.ComboBoxText()
+        for style_id, style_name in _TICK_STYLES:
+            self.style_combo.append(style_id, style_name)
+        self.style_combo.set_active_id(hour_tick_style)
+        self._bind_control(lambda theme, w=self.style_combo: w.set_active_id(theme.get('hour_tick_style')))
+        self.style_combo.set_halign(Gtk.Align.START)
+        self.style_combo.connect("changed", self.on_hour_tick_style_changed)
+        self.hour_tick_controls.append(self.style_combo)
+        grid.attach(self.style_combo, 1, row, 1, 1)
+        row += 1
+        
+        # Size slider - track its widgets
+        size_label = self._mklabel("Size:")
+        self.hour_tick_controls.append(size_label)
+        grid.attach(size_label, 0, row, 1, 1)
+        
+        size_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0.01, 0.05, 0.001)
+        size_scale.set_value(theme.get('hour_tick_size'))
+        size_scale.set_properties(hexpand=True, value_pos=Gtk.PositionType.RIGHT, digits=3)
+        self._connect_scale(size_scale, self.on_hour_tick_size_changed)
+        self.hour_tick_controls.append(size_scale)
+        grid.attach(size_scale, 1, row, 1, 1)
+        row += 1
+        
+        # Shape slider (only visible for rectangular style)
+        self.shape_label = self._mklabel("Shape:")
+        grid.attach(self.shape_label, 0, row, 1, 1)
+        
+        # Track shape widgets for visibility toggling. The slider itself is only
+        # built once the style is rectangular (see _ensure_hour_shape_scale).
+        self.hour_tick_shape_widgets.append(self.shape_label)
+        self.shape_scale = None
+        self.hour_shape_row = row
+        if hour_tick_style == "rectangular":
+            self._ensure_hour_shape_scale()
+        row += 1
+        
+        # Color button - track its widgets
+        ticks_color_widgets = self._add_color_button(grid, row, "Color:", theme.get('ticks_color'),
+                              self.on_ticks_color_changed)
+        self.hour_tick_controls.extend(ticks_color_widgets[:2])
+        self.ticks_color_button = ticks_color_widgets[2]
+        self._bind_color_button(self.ticks_color_button, 'ticks_color')
+        
+        return self.hour_tick_controls + self.hour_tick_shape_widgets
+    
+    def _build_minute_tick_controls(self, row):
+        """Add the minute tick style, size, shape and color rows to the ticks grid.
+        Returns the widgets added."""
+        theme = self.parent_clock.theme
+        grid = self.ticks_grid
+        minute_tick_style = theme.get('minute_tick_style')
+        
+        # Minute tick style dropdown
+        label = self._mklabel("Style:")
+        self.minute_tick_controls.append(label)
+        grid.attach(label, 0, row, 1, 1)
+        
+        self.minute_style_combo = Gtk.ComboBoxText()
+        self.minute_tick_controls.append(self.minute_style_combo)
+        for style_id, style_name in _TICK_STYLES:
+            self.minute_style_combo.append(style_id, style_name)
+        self.minute_style_combo.set_active_id(minute_tick_style)
+        self._bind_control(lambda theme, w=self.minute_style_combo: w.set_active_id(theme.get('minute_tick_style')))
+        self.minute_style_combo.set_halign(Gtk.Align.START)
+        self.minute_style_combo.connect("changed", self.on_minute_tick_style_changed)
+        grid.attach(self.minute_style_combo, 1, row, 1, 1)
+        row += 1
+        
+        # Track size slider widgets
+        size_widgets = self._add_slider(grid, row, "Size:", theme.get('minute_tick_size'), 0.01, 0.05,
+                        self.on_minute_tick_size_changed)
+        self.minute_tick_controls.extend(size_widgets)
+        row += 1
+        
+        # Minute shape slider (only visible for rectangular style)
+        self.minute_shape_label = self._mklabel("Shape:")
+        grid.attach(self.minute_shape_label, 0, row, 1, 1)
+        
+        # Track shape widgets for visibility toggling (slider built lazily as above)
+        self.minute_tick_shape_widgets.append(self.minute_shape_label)
+        self.minute_shape_scale = None
+        self.minute_shape_row = row
+        if minute_tick_style == "rectangular":
+            self._ensure_minute_shape_scale()
+        row += 1
+        
+        # Color button
+        minute_ticks_color_widgets = self._add_color_button(grid, row, "Color:", theme.get('minute_ticks_color'),
+                              self.on_minute_ticks_color_changed)
+        self.minute_tick_controls.extend(minute_ticks_color_widgets[:2])
+        self.minute_ticks_color_button = minute_ticks_color_widgets[2]
+        self._bind_color_button(self.minute_ticks_color_button, 'minute_ticks_color')
+        
+        return self.minute_tick_controls + self.minute_tick_shape_widgets
+    
+    def _defer_tick_controls(self, kind, build, update_visibility):
+        """Run build() from an idle callback, or earlier via _ensure_tick_controls"""
+        def run():
+            del self._deferred_tick_controls[kind]
+            # Not covered by the page's show_all, so show them here and
+            # let the visibility updater hide what should stay hidden
+            for widget in build():
+                widget.show_all()
+            update_visibility()
+            return False
+        self._deferred_tick_controls[kind] = (GLib.idle_add(run, priority=GLib.PRIORITY_LOW), run)
+    
+    def _ensure_tick_controls(self, kind):
+        """Build a deferred tick section now if its idle callback hasn't run yet"""
+        pending = self._deferred_tick_controls.get(kind)
+        if pending is not None:
+            GLib.source_remove(pending[0])
+            pending[1]()
+    
+    def _ensure_hour_shape_scale(self):
+        """Build the hour tick shape slider on first use"""
+        if self.shape_scale is None:
+            # Uses logarithmic scale, where 0 = square (1.0)
+            # Negative = taller, Positive = wider
+            self.shape_scale = self._create_shape_scale(self.hour_shape_row, 'hour_tick_aspect_ratio',
+                                                        -1.5, "Tall", self.on_hour_tick_shape_changed)
+            self.hour_tick_shape_widgets.append(self.shape_scale)
+    
+    def _ensure_minute_shape_scale(self):
+        """Build the minute tick shape slider on first use"""
+        if self.minute_shape_scale is None:
+            self.minute_shape_scale = self._create_shape_scale(self.minute_shape_row, 'minute_tick_aspect_ratio',
+                                                               -3.3, "Skinny", self.on_minute_tick_shape_changed)
+            self.minute_tick_shape_widgets.append(self.minute_shape_scale)
+    
+    def _create_shape_scale(self, row, ratio_key, min_val, min_mark, callback):
+        """Attach a log2 aspect ratio slider to the ticks grid and return it"""
+        # Convert aspect ratio to log scale for slider
+        current_ratio = self.parent_clock.theme.get(ratio_key)
+        slider_value = _log2(float(current_ratio)) if current_ratio > 0 else 0.0
+        
+        scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, min_val, 1.5, 0.1)
+        scale.set_value(slider_value)
+        scale.set_properties(hexpand=True, width_request=400, value_pos=Gtk.PositionType.RIGHT, digits=1)
+        
+        # Add marks for reference
+        scale.add_mark(0, Gtk.PositionType.BOTTOM, "Square")
+        scale.add_mark(min_val, Gtk.PositionType.BOTTOM, min_mark)
+        scale.add_mark(1.5, Gtk.PositionType.BOTTOM, "Wide")
+        
+        self._connect_scale(scale, callback)
+        self.ticks_grid.attach(scale, 1, row, 1, 1)
+        scale.show()
+        return scale
     
     def on_hour_tick_style_changed(self, combo):
         style = combo.get_active_id()
@@ -2739,6 +2958,8 @@ class CustomizeDialog(Gtk.Dialog):
         
         # Update visibility of shape control based on style
         is_rectangular = (style == 'rectangular')
+        if is_rectangular:
+            self._ensure_hour_shape_scale()
         for widget in self.hour_tick_shape_widgets:
             widget.set_visible(is_rectangular)
     
@@ -2748,9 +2969,8 @@ class CustomizeDialog(Gtk.Dialog):
     
     def on_hour_tick_shape_changed(self, scale):
         # Convert logarithmic slider value to aspect ratio
-        import math
         slider_value = scale.get_value()
-        aspect_ratio = math.pow(2, slider_value)
+        aspect_ratio = 2.0 ** slider_value
         self.parent_clock.theme.set('hour_tick_aspect_ratio', aspect_ratio)
     
     def on_tick_position_changed(self, scale):
@@ -2758,9 +2978,7 @@ class CustomizeDialog(Gtk.Dialog):
         position = scale.get_value()
         self.parent_clock.theme.set('hour_tick_position', position)
         self.parent_clock.theme.set('minute_tick_position', position)
-        self._mark_dirty()
-        self._regenerate_current_theme_preview()
-        self.parent_clock.queue_draw()
+        self._invalidate_theme()
     
     def on_ticks_color_changed(self, button):
         color = self._rgba_to_tuple(button.get_rgba())
@@ -2772,6 +2990,8 @@ class CustomizeDialog(Gtk.Dialog):
         
         # Update visibility of shape control based on style
         is_rectangular = (style == 'rectangular')
+        if is_rectangular:
+            self._ensure_minute_shape_scale()
         for widget in self.minute_tick_shape_widgets:
             widget.set_visible(is_rectangular)
     
@@ -2782,9 +3002,8 @@ class CustomizeDialog(Gtk.Dialog):
     
     def on_minute_tick_shape_changed(self, scale):
         # Convert logarithmic slider value to aspect ratio
-        import math
         slider_value = scale.get_value()
-        aspect_ratio = math.pow(2, slider_value)
+        aspect_ratio = 2.0 ** slider_value
         self._on_theme_property_changed('minute_tick_aspect_ratio', aspect_ratio)
     
     def on_minute_ticks_color_changed(self, button):
@@ -2799,11 +3018,15 @@ class CustomizeDialog(Gtk.Dialog):
     def on_show_hour_ticks_toggled(self, switch, gparam):
         value = switch.get_active()
         self._on_theme_property_changed('show_hour_ticks', value)
+        if value:
+            self._ensure_tick_controls('hour')
         self._update_hour_tick_controls_visibility()
     
     def on_show_minute_ticks_toggled(self, switch, gparam):
         value = switch.get_active()
         self._on_theme_property_changed('show_minute_ticks', value)
+        if value:
+            self._ensure_tick_controls('minute')
         self._update_minute_tick_controls_visibility()
     
     def on_number_position_changed(self, scale):
@@ -2824,18 +3047,6 @@ class CustomizeDialog(Gtk.Dialog):
         font_family = font_desc.split()[0] if font_desc else "Sans"
         self._on_theme_property_changed('number_font', font_family)
     
-    def on_number_bold_toggled(self, switch, gparam):
-        value = switch.get_active()
-        self._on_theme_property_changed('number_bold', value)
-    
-    def on_roman_numerals_toggled(self, switch, gparam):
-        value = switch.get_active()
-        self._on_theme_property_changed('use_roman_numerals', value)
-    
-    def on_cardinal_numbers_toggled(self, switch, gparam):
-        value = switch.get_active()
-        self._on_theme_property_changed('show_cardinal_numbers_only', value)
-    
     def on_hour_hand_length_changed(self, scale):
         value = scale.get_value()
         self._on_theme_property_changed('hour_hand_length', value)
@@ -2845,15 +3056,17 @@ class CustomizeDialog(Gtk.Dialog):
         self._on_theme_property_changed('hour_hand_tail', value)
     
     def on_hour_hand_width_changed(self, scale):
+        self._on_hand_width_changed('hour', scale)
+    
+    def _on_hand_width_changed(self, hand_type, scale):
+        """Save a width slider's value to the property its current mode edits"""
         value = scale.get_value()
-        # Check if we're in image mode or geometric mode
-        source = self.parent_clock.theme.get('hour_hand_image_source')
-        if source != 'none':
-            # Image mode - save to image_width
-            self._on_theme_property_changed('hour_hand_image_width', value)
+        if self._width_modes.get(hand_type) == 'image':
+            # Image mode - slider is in log space, save to image_width
+            self._on_theme_property_changed(f'{hand_type}_hand_image_width', _exp(value))
         else:
             # Geometric mode - save to width
-            self._on_theme_property_changed('hour_hand_width', value)
+            self._on_theme_property_changed(f'{hand_type}_hand_width', value)
     
     def on_hands_color_changed(self, button):
         color = self._rgba_to_tuple(button.get_rgba())
@@ -2871,15 +3084,7 @@ class CustomizeDialog(Gtk.Dialog):
         self._on_theme_property_changed('minute_hand_tail', value)
     
     def on_minute_hand_width_changed(self, scale):
-        value = scale.get_value()
-        # Check if we're in image mode or geometric mode
-        source = self.parent_clock.theme.get('minute_hand_image_source')
-        if source != 'none':
-            # Image mode - save to image_width
-            self._on_theme_property_changed('minute_hand_image_width', value)
-        else:
-            # Geometric mode - save to width
-            self._on_theme_property_changed('minute_hand_width', value)
+        self._on_hand_width_changed('minute', scale)
     
     def on_minute_hand_snap_toggled(self, switch, gparam):
         value = switch.get_active()
@@ -2899,15 +3104,7 @@ class CustomizeDialog(Gtk.Dialog):
         self._on_theme_property_changed('second_hand_tail', value)
     
     def on_second_hand_width_changed(self, scale):
-        value = scale.get_value()
-        # Check if we're in image mode or geometric mode
-        source = self.parent_clock.theme.get('second_hand_image_source')
-        if source != 'none':
-            # Image mode - save to image_width
-            self._on_theme_property_changed('second_hand_image_width', value)
-        else:
-            # Geometric mode - save to width
-            self._on_theme_property_changed('second_hand_width', value)
+        self._on_hand_width_changed('second', scale)
     
     def on_second_hand_color_changed(self, button):
         color = self._rgba_to_tuple(button.get_rgba())
@@ -2948,7 +3145,6 @@ class CustomizeDialog(Gtk.Dialog):
             # Use predefined format
             self._on_theme_property_changed('date_format', format_id)
             self.custom_date_format = None
-            self.parent_clock.queue_draw()
             # Hide edit button
             self.edit_custom_format_button.set_visible(False)
     
@@ -2958,8 +3154,6 @@ class CustomizeDialog(Gtk.Dialog):
     
     def _show_custom_date_format_dialog(self):
         """Show dialog for entering custom date format"""
-        import datetime
-        
         dialog = Gtk.Dialog(
             title="Custom Date Format",
             parent=self,
@@ -3002,7 +3196,7 @@ class CustomizeDialog(Gtk.Dialog):
         
         def update_preview(*args):
             try:
-                now = datetime.datetime.now()
+                now = _datetime.now()
                 preview_text = now.strftime(entry.get_text())
                 preview_label.set_markup(f"<b>Preview:</b> {preview_text}")
             except Exception as e:
@@ -3018,37 +3212,33 @@ class CustomizeDialog(Gtk.Dialog):
             custom_format = entry.get_text()
             try:
                 # Validate format
-                datetime.datetime.now().strftime(custom_format)
+                _datetime.now().strftime(custom_format)
                 self.custom_date_format = custom_format
                 self._on_theme_property_changed('date_format', custom_format)
-                self.parent_clock.queue_draw()
             except Exception:
                 # Invalid format, revert combo
-                if self.custom_date_format:
-                    self.date_format_combo.set_active_id("custom")
-                else:
-                    current_format = self.parent_clock.theme.get('date_format')
-                    self.date_format_combo.set_active_id(current_format)
+                self._revert_date_format_combo()
         else:
             # User cancelled, revert combo
-            if self.custom_date_format:
-                self.date_format_combo.set_active_id("custom")
-            else:
-                current_format = self.parent_clock.theme.get('date_format')
-                self.date_format_combo.set_active_id(current_format)
+            self._revert_date_format_combo()
         
         dialog.destroy()
     
+    def _revert_date_format_combo(self):
+        """Reselect the theme's date format without it counting as a change"""
+        self.date_format_combo.handler_block(self._date_format_handler)
+        if self.custom_date_format:
+            self.date_format_combo.set_active_id("custom")
+        else:
+            self.date_format_combo.set_active_id(self.parent_clock.theme.get('date_format'))
+        self.date_format_combo.handler_unblock(self._date_format_handler)
+    
     def on_date_font_changed(self, font_button):
         # Extract just the font family name from the font description
         font_desc = font_button.get_font()
         font_family = font_desc.split()[0] if font_desc else "Sans"
         self._on_theme_property_changed('date_font', font_family)
     
-    def on_date_bold_toggled(self, switch, gparam):
-        value = switch.get_active()
-        self._on_theme_property_changed('date_bold', value)
-    
     def on_date_text_color_changed(self, button):
         color = self._rgba_to_tuple(button.get_rgba())
         self._on_theme_property_changed('date_text_color', color)
@@ -3066,8 +3256,7 @@ class CustomizeDialog(Gtk.Dialog):
             self.parent_clock.theme.set(f'{hand_type}_hand_image_source', source)
             self.parent_clock.theme.set(f'{hand_type}_hand_image_name', name)
         
-        # Update label
-        self.hand_theme_label.set_text(self._format_hand_theme_label())
+        self._refresh_hand_labels()
         
         # Update visibility of controls
         self._update_hand_controls_visibility()
@@ -3075,9 +3264,7 @@ class CustomizeDialog(Gtk.Dialog):
         # Clear hand image cache so new hand images are loaded
         self.parent_clock.clear_hand_image_cache()
         
-        self._mark_dirty()
-        self._regenerate_current_theme_preview()
-        self.parent_clock.queue_draw()
+        self._invalidate_theme()
     
     def on_clear_hand_theme_clicked(self, button):
         """Clear hand images for all hands"""
@@ -3086,15 +3273,12 @@ class CustomizeDialog(Gtk.Dialog):
             self.parent_clock.theme.set(f'{hand_type}_hand_image_source', 'none')
             self.parent_clock.theme.set(f'{hand_type}_hand_image_name', None)
         
-        # Update label
-        self.hand_theme_label.set_text('(none)')
+        self._refresh_hand_labels()
         
         # Update visibility of controls
         self._update_hand_controls_visibility()
         
-        self._mark_dirty()
-        self._regenerate_current_theme_preview()
-        self.parent_clock.queue_draw()
+        self._invalidate_theme()
     
     def on_choose_hand_image_clicked(self, hand_type):
         """Open hand image picker dialog for specified hand type (hour, minute, second)"""
@@ -3106,28 +3290,18 @@ class CustomizeDialog(Gtk.Dialog):
         self.parent_clock.theme.set(f'{hand_type}_hand_image_source', source)
         self.parent_clock.theme.set(f'{hand_type}_hand_image_name', name)
         
-        # Update label
-        label_attr = f'{hand_type}_hand_image_label'
-        if hasattr(self, label_attr):
-            getattr(self, label_attr).set_text(self._format_hand_image_label(hand_type))
+        self._refresh_hand_labels()
         
-        self._mark_dirty()
-        self._regenerate_current_theme_preview()
-        self.parent_clock.queue_draw()
+        self._invalidate_theme()
     
     def on_clear_hand_image_clicked(self, hand_type):
         """Clear hand image for specified hand type"""
         self.parent_clock.theme.set(f'{hand_type}_hand_image_source', 'none')
         self.parent_clock.theme.set(f'{hand_type}_hand_image_name', None)
         
-        # Update label
-        label_attr = f'{hand_type}_hand_image_label'
-        if hasattr(self, label_attr):
-            getattr(self, label_attr).set_text('(none)')
+        self._refresh_hand_labels()
         
-        self._mark_dirty()
-        self._regenerate_current_theme_preview()
-        self.parent_clock.queue_draw()
+        self._invalidate_theme()
     
     def on_autostart_toggled(self, switch, gparam):
         if switch.get_active():
@@ -3140,31 +3314,37 @@ class CustomizeDialog(Gtk.Dialog):
         self._on_settings_property_changed('show_date_box', value)
         self.parent_clock.update_window_size()
         self.parent_clock.save_geometry()
-        self.parent_clock.queue_draw()
     
     def on_show_seconds_toggled(self, switch, gparam):
         value = switch.get_active()
+        self._cached_show_seconds = value
         self._on_settings_property_changed('show_second_hand', value)
         self.parent_clock.save_geometry()
-        self.parent_clock.queue_draw()
     
     def _update_hour_tick_controls_visibility(self):
         """Show/hide hour tick controls based on show_hour_ticks_switch"""
+        if 'hour' in self._deferred_tick_controls:
+            return
         visible = self.show_hour_ticks_switch.get_active()
-        for control in self.hour_tick_controls:
-            control.set_visible(visible)
+        pairs = [(control, visible) for control in self.hour_tick_controls]
         
         # Shape widgets have additional visibility condition (only for rectangular style)
         is_rectangular = self.style_combo.get_active_id() == 'rectangular'
         shape_visible = visible and is_rectangular
-        for widget in self.hour_tick_shape_widgets:
-            widget.set_visible(shape_visible)
+        pairs += [(widget, shape_visible) for widget in self.hour_tick_shape_widgets]
+        self._apply_visibility(pairs)
     
     def _update_minute_tick_controls_visibility(self):
         """Show/hide minute tick controls based on show_minute_ticks_switch"""
+        if 'minute' in self._deferred_tick_controls:
+            return
         visible = self.show_minute_ticks_switch.get_active()
-        for control in self.minute_tick_controls:
-            control.set_visible(visible)
+        pairs = [(control, visible) for control in self.minute_tick_controls]
+        
+        # Shape widgets are only shown for the rectangular style, as for hour ticks
+        shape_visible = visible and self.minute_style_combo.get_active_id() == 'rectangular'
+        pairs += [(widget, shape_visible) for widget in self.minute_tick_shape_widgets]
+        self._apply_visibility(pairs)
     
     def _has_hand_images(self):
         """Check if any hand has an image"""
@@ -3286,5 +3466,4 @@ class CustomizeDialog(Gtk.Dialog):
     def _update_number_controls_visibility(self):
         """Show/hide number controls based on show_numbers_switch"""
         visible = self.show_numbers_switch.get_active()
-        for control in self.number_controls:
-            control.set_visible(visible)
+        self._apply_visibility([(control, visible) for control in self.number_controls])
@@ -194,6 +194,8 @@ class AnalogClock(Gtk.Window):
         self.connect('configure-event', self.on_configure)
 
         self._texture_surface_cache = {}
+        # (path, future) of a texture decode started ahead of its first draw
+        self._texture_preload = None
 
     def get_builtin_textures_dir(self):
         snap_dir = os.environ.get('SNAP')
@@ -212,15 +214,23 @@ class AnalogClock(Gtk.Window):
         if snap_user_data:
             return os.path.join(snap_user_data, 'hands')
         return os.path.expanduser('~/.config/dsclock/hands')
+
+    def get_thumbnail_cache_dir(self):
+        snap_user_data = os.environ.get('SNAP_USER_DATA')
+        if snap_user_data:
+            return os.path.join(snap_user_data, 'cache', 'thumbs')
+        return os.path.expanduser('~/.cache/dsclock/thumbs')
     
-    def resolve_hand_image_path(self, hand_type):
+    def resolve_hand_image_path(self, hand_type, theme=None):
         """
         Resolve path to hand image for specified hand type (hour, minute, second).
         Uses processed images if available, falls back to original if not.
         Returns None if no hand image is configured.
         """
-        source = self.theme.get(f'{hand_type}_hand_image_source')
-        name = self.theme.get(f'{hand_type}_hand_image_name')
+        if theme is None:
+            theme = self.theme
+        source = theme.get(f'{hand_type}_hand_image_source')
+        name = theme.get(f'{hand_type}_hand_image_name')
         
         if source == 'none' or not name:
             return None
@@ -251,16 +261,40 @@ class AnalogClock(Gtk.Window):
             return os.path.join(self.get_user_textures_dir(), name)
         return os.path.join(self.get_builtin_textures_dir(), name)
 
+    def preload_texture(self, path, executor):
+        """Start decoding the texture at path on executor, so the first draw that
+        uses it only waits for whatever is left of the decode. Only the latest
+        preload is kept."""
+        if self._texture_preload is not None and self._texture_preload[0] == path:
+            return
+        self.cancel_texture_preload()
+        if not path or path in self._texture_surface_cache:
+            return
+        self._texture_preload = (path, executor.submit(GdkPixbuf.Pixbuf.new_from_file, path))
+
+    def cancel_texture_preload(self):
+        """Drop a pending preload (and its decoded pixbuf) that no draw will use"""
+        if self._texture_preload is not None:
+            self._texture_preload[1].cancel()
+            self._texture_preload = None
+
     def _get_texture_surface(self, path):
         if not path:
             return None
         if path in self._texture_surface_cache:
             return self._texture_surface_cache[path]
+        preload = None
+        if self._texture_preload is not None and self._texture_preload[0] == path:
+            preload = self._texture_preload[1]
+            self._texture_preload = None
         if not os.path.exists(path):
             self._texture_surface_cache[path] = None
             return None
         try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
+            if preload is not None and not preload.cancelled():
+                pixbuf = preload.result()
+            else:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
             w = pixbuf.get_width()
             h = pixbuf.get_height()
             surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
@@ -743,22 +777,24 @@ X-GNOME-Autostart-enabled=true
         # Draw the clock using shared rendering method
         self._draw_clock_face(cr, center_x, center_y, radius, show_date, show_seconds, date_box_margin, date_box_height, date_box_width)
     
-    def _draw_clock_face(self, cr, center_x, center_y, radius, show_date=False, show_seconds=True, date_box_margin=0.08, date_box_height=0.2, date_box_width=1.2):
+    def _draw_clock_face(self, cr, center_x, center_y, radius, show_date=False, show_seconds=True, date_box_margin=0.08, date_box_height=0.2, date_box_width=1.2, theme=None):
         """Shared method to draw clock face - used by both main rendering and preview generation"""
+        if theme is None:
+            theme = self.theme
         
         # Get theme properties
-        rim_width = self.theme.get('rim_width')
-        rim_color = self.theme.get('rim_color')
-        rim_opacity = self.theme.get('rim_opacity')
-        enable_face_color = self.theme.get('enable_face_color')
-        background_color = self.theme.get('background_color')
-        face_color_opacity = self.theme.get('face_color_opacity')
-        enable_face_texture = self.theme.get('enable_face_texture')
-        face_texture_name = self.theme.get('face_texture_name')
-        face_texture_source = self.theme.get('face_texture_source')
-        face_texture_opacity = self.theme.get('face_texture_opacity')
-        hands_color = self.theme.get('hands_color')
-        center_dot_radius = self.theme.get('center_dot_radius')
+        rim_width = theme.get('rim_width')
+        rim_color = theme.get('rim_color')
+        rim_opacity = theme.get('rim_opacity')
+        enable_face_color = theme.get('enable_face_color')
+        background_color = theme.get('background_color')
+        face_color_opacity = theme.get('face_color_opacity')
+        enable_face_texture = theme.get('enable_face_texture')
+        face_texture_name = theme.get('face_texture_name')
+        face_texture_source = theme.get('face_texture_source')
+        face_texture_opacity = theme.get('face_texture_opacity')
+        hands_color = theme.get('hands_color')
+        center_dot_radius = theme.get('center_dot_radius')
         
         outer_radius = radius
         rim_thickness = outer_radius * rim_width
@@ -791,7 +827,7 @@ X-GNOME-Autostart-enabled=true
         cr.fill()
         
         # Draw hour ticks and Arabic numerals
-        self.draw_ticks_and_numbers(cr, center_x, center_y, face_radius)
+        self.draw_ticks_and_numbers(cr, center_x, center_y, face_radius, theme=theme)
         
         # Get current time
         now = datetime.now()
@@ -800,10 +836,10 @@ X-GNOME-Autostart-enabled=true
         seconds = now.second
         
         # Draw hands
-        self.draw_hour_hand(cr, center_x, center_y, face_radius, hours, minutes)
-        self.draw_minute_hand(cr, center_x, center_y, face_radius, minutes, seconds)
+        self.draw_hour_hand(cr, center_x, center_y, face_radius, hours, minutes, theme=theme)
+        self.draw_minute_hand(cr, center_x, center_y, face_radius, minutes, seconds, theme=theme)
         if show_seconds:
-            self.draw_second_hand(cr, center_x, center_y, face_radius, seconds)
+            self.draw_second_hand(cr, center_x, center_y, face_radius, seconds, theme=theme)
         
         # Draw center dot
         cr.set_source_rgba(hands_color[0], hands_color[1], hands_color[2], 0.9)
@@ -830,10 +866,10 @@ X-GNOME-Autostart-enabled=true
             inner_corner_radius = max(0.0, outer_corner_radius - date_box_rim_thickness)
             
             # Get theme properties for date box
-            date_text_color = self.theme.get('date_text_color')
-            date_font = self.theme.get('date_font')
-            date_bold = self.theme.get('date_bold')
-            date_font_size = self.theme.get('date_font_size')
+            date_text_color = theme.get('date_text_color')
+            date_font = theme.get('date_font')
+            date_bold = theme.get('date_bold')
+            date_font_size = theme.get('date_font_size')
             
             # Draw rim first (outer rectangle minus inner rectangle using even-odd fill rule)
             cr.set_source_rgba(rim_color[0], rim_color[1], rim_color[2], rim_opacity)
@@ -866,7 +902,7 @@ X-GNOME-Autostart-enabled=true
                     cr.restore()
             
             # Draw date text (centered in inner area)
-            date_format = self.theme.get('date_format')
+            date_format = theme.get('date_format')
             date_text = now.strftime(date_format)
             cr.set_source_rgba(date_text_color[0], date_text_color[1], date_text_color[2], 0.9)
             date_font_weight = cairo.FONT_WEIGHT_BOLD if date_bold else cairo.FONT_WEIGHT_NORMAL
@@ -895,30 +931,32 @@ X-GNOME-Autostart-enabled=true
         }
         return roman_map.get(num, str(num))
     
-    def draw_ticks_and_numbers(self, cr, cx, cy, radius):
+    def draw_ticks_and_numbers(self, cr, cx, cy, radius, theme=None):
         """Draw hour ticks and numerals (Arabic or Roman)"""
+        if theme is None:
+            theme = self.theme
         
         # Get theme properties
-        show_hour_ticks = self.theme.get('show_hour_ticks')
-        show_numbers = self.theme.get('show_numbers')
-        show_minute_ticks = self.theme.get('show_minute_ticks')
-        ticks_color = self.theme.get('ticks_color')
-        numbers_color = self.theme.get('numbers_color')
-        minute_ticks_color = self.theme.get('minute_ticks_color')
-        hour_tick_size = self.theme.get('hour_tick_size')
-        hour_tick_position = self.theme.get('hour_tick_position')
-        hour_tick_style = self.theme.get('hour_tick_style')
-        hour_tick_aspect_ratio = self.theme.get('hour_tick_aspect_ratio')
-        minute_tick_size = self.theme.get('minute_tick_size')
-        minute_tick_position = self.theme.get('minute_tick_position')
-        minute_tick_style = self.theme.get('minute_tick_style')
-        minute_tick_aspect_ratio = self.theme.get('minute_tick_aspect_ratio')
-        number_position = self.theme.get('number_position')
-        number_size = self.theme.get('number_size')
-        number_font = self.theme.get('number_font')
-        number_bold = self.theme.get('number_bold')
-        use_roman_numerals = self.theme.get('use_roman_numerals')
-        show_cardinal_numbers_only = self.theme.get('show_cardinal_numbers_only')
+        show_hour_ticks = theme.get('show_hour_ticks')
+        show_numbers = theme.get('show_numbers')
+        show_minute_ticks = theme.get('show_minute_ticks')
+        ticks_color = theme.get('ticks_color')
+        numbers_color = theme.get('numbers_color')
+        minute_ticks_color = theme.get('minute_ticks_color')
+        hour_tick_size = theme.get('hour_tick_size')
+        hour_tick_position = theme.get('hour_tick_position')
+        hour_tick_style = theme.get('hour_tick_style')
+        hour_tick_aspect_ratio = theme.get('hour_tick_aspect_ratio')
+        minute_tick_size = theme.get('minute_tick_size')
+        minute_tick_position = theme.get('minute_tick_position')
+        minute_tick_style = theme.get('minute_tick_style')
+        minute_tick_aspect_ratio = theme.get('minute_tick_aspect_ratio')
+        number_position = theme.get('number_position')
+        number_size = theme.get('number_size')
+        number_font = theme.get('number_font')
+        number_bold = theme.get('number_bold')
+        use_roman_numerals = theme.get('use_roman_numerals')
+        show_cardinal_numbers_only = theme.get('show_cardinal_numbers_only')
         
         for i in range(12):
             angle = math.radians(i * 30 - 90)  # -90 to start at 12 o'clock
@@ -1033,18 +1071,20 @@ X-GNOME-Autostart-enabled=true
                         cr.fill()
                         cr.restore()
     
-    def draw_hour_hand(self, cr, cx, cy, radius, hours, minutes):
+    def draw_hour_hand(self, cr, cx, cy, radius, hours, minutes, theme=None):
         """Draw hour hand - either as image or geometric shape"""
+        if theme is None:
+            theme = self.theme
         # Check if hand image is configured
-        hand_image_path = self.resolve_hand_image_path('hour')
+        hand_image_path = self.resolve_hand_image_path('hour', theme)
         if hand_image_path:
-            self._draw_hand_image(cr, cx, cy, radius, hand_image_path, hours, minutes, 'hour')
+            self._draw_hand_image(cr, cx, cy, radius, hand_image_path, hours, minutes, 'hour', theme=theme)
         else:
             # Draw geometric hand
-            hands_color = self.theme.get('hands_color')
-            hour_hand_length = self.theme.get('hour_hand_length')
-            hour_hand_tail = self.theme.get('hour_hand_tail')
-            hour_hand_width = self.theme.get('hour_hand_width')
+            hands_color = theme.get('hands_color')
+            hour_hand_length = theme.get('hour_hand_length')
+            hour_hand_tail = theme.get('hour_hand_tail')
+            hour_hand_width = theme.get('hour_hand_width')
             
             angle = math.radians((hours + minutes / 60) * 30 - 90)
             length = radius * hour_hand_length
@@ -1065,18 +1105,20 @@ X-GNOME-Autostart-enabled=true
             cr.line_to(x_tip, y_tip)
             cr.stroke()
     
-    def draw_minute_hand(self, cr, cx, cy, radius, minutes, seconds=0):
+    def draw_minute_hand(self, cr, cx, cy, radius, minutes, seconds=0, theme=None):
         """Draw minute hand - either as image or geometric shape"""
+        if theme is None:
+            theme = self.theme
         # Check if hand image is configured
-        hand_image_path = self.resolve_hand_image_path('minute')
+        hand_image_path = self.resolve_hand_image_path('minute', theme)
         if hand_image_path:
-            self._draw_hand_image(cr, cx, cy, radius, hand_image_path, 0, minutes, 'minute', seconds)
+            self._draw_hand_image(cr, cx, cy, radius, hand_image_path, 0, minutes, 'minute', seconds, theme=theme)
         else:
             # Draw geometric hand
-            hands_color = self.theme.get('hands_color')
-            minute_hand_length = self.theme.get('minute_hand_length')
-            minute_hand_tail = self.theme.get('minute_hand_tail')
-            minute_hand_width = self.theme.get('minute_hand_width')
+            hands_color = theme.get('hands_color')
+            minute_hand_length = theme.get('minute_hand_length')
+            minute_hand_tail = theme.get('minute_hand_tail')
+            minute_hand_width = theme.get('minute_hand_width')
             minute_hand_snap = self.settings.get('minute_hand_snap')
         
             # Optionally snap to minute marks
@@ -1103,18 +1145,20 @@ X-GNOME-Autostart-enabled=true
             cr.line_to(x_tip, y_tip)
             cr.stroke()
     
-    def draw_second_hand(self, cr, cx, cy, radius, seconds):
+    def draw_second_hand(self, cr, cx, cy, radius, seconds, theme=None):
         """Draw second hand - either as image or geometric shape"""
+        if theme is None:
+            theme = self.theme
         # Check if hand image is configured
-        hand_image_path = self.resolve_hand_image_path('second')
+        hand_image_path = self.resolve_hand_image_path('second', theme)
         if hand_image_path:
-            self._draw_hand_image(cr, cx, cy, radius, hand_image_path, 0, 0, 'second', seconds)
+            self._draw_hand_image(cr, cx, cy, radius, hand_image_path, 0, 0, 'second', seconds, theme=theme)
         else:
             # Draw geometric hand
-            second_hand_color = self.theme.get('second_hand_color')
-            second_hand_length = self.theme.get('second_hand_length')
-            second_hand_tail = self.theme.get('second_hand_tail')
-            second_hand_width = self.theme.get('second_hand_width')
+            second_hand_color = theme.get('second_hand_color')
+            second_hand_length = theme.get('second_hand_length')
+            second_hand_tail = theme.get('second_hand_tail')
+            second_hand_width = theme.get('second_hand_width')
         
             angle = math.radians(seconds * 6 - 90)
             length = radius * second_hand_length
@@ -1171,20 +1215,22 @@ X-GNOME-Autostart-enabled=true
         
         return None
     
-    def _draw_hand_image(self, cr, cx, cy, radius, image_path, hours, minutes, hand_type, seconds=0):
+    def _draw_hand_image(self, cr, cx, cy, radius, image_path, hours, minutes, hand_type, seconds=0, theme=None):
         """
         Draw a hand using an image file.
         The image should be in 12 o'clock position (pointing up).
         A single red pixel (255, 0, 0) marks the rotation center.
         """
+        if theme is None:
+            theme = self.theme
         try:
             from gi.repository import GdkPixbuf
             
             # Get hand color from theme
             if hand_type == 'second':
-                hand_color = self.theme.get('second_hand_color')
+                hand_color = theme.get('second_hand_color')
             else:  # hour or minute
-                hand_color = self.theme.get('hands_color')
+                hand_color = theme.get('hands_color')
             
             # Create cache key based on image path and color (convert color to tuple for hashing)
             cache_key = (image_path, tuple(hand_color))
@@ -1238,14 +1284,14 @@ X-GNOME-Autostart-enabled=true
             # Get hand length and width from theme
             # Use image_width for hand images (scale factor)
             if hand_type == 'hour':
-                hand_length = self.theme.get('hour_hand_length')
-                hand_width = self.theme.get('hour_hand_image_width')
+                hand_length = theme.get('hour_hand_length')
+                hand_width = theme.get('hour_hand_image_width')
             elif hand_type == 'minute':
-                hand_length = self.theme.get('minute_hand_length')
-                hand_width = self.theme.get('minute_hand_image_width')
+                hand_length = theme.get('minute_hand_length')
+                hand_width = theme.get('minute_hand_image_width')
             else:  # second
-                hand_length = self.theme.get('second_hand_length')
-                hand_width = self.theme.get('second_hand_image_width')
+                hand_length = theme.get('second_hand_length')
+                hand_width = theme.get('second_hand_image_width')
             
             # Calculate scale factors
             # Length: distance from red pixel to top of image should match desired hand length